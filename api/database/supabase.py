@@ -112,16 +112,16 @@ class SupabaseDB:
                 "school_name": lead.get("school_name"),
                 "person_name": lead.get("person_name"),
                 "role": lead.get("role"),
-                "role_indonesian": lead.get("role_indonesian"),
+                "role_indonesian": lead.get("role_indonesian") or None,
                 "priority_tier": lead.get("priority_tier"),
-                "direct_whatsapp": lead.get("direct_whatsapp"),
+                "direct_whatsapp": lead.get("direct_whatsapp") or None,
                 "whatsapp_verified": lead.get("whatsapp_verified", False),
-                "direct_email": lead.get("direct_email"),
+                "direct_email": lead.get("direct_email") or None,
                 "email_verified": lead.get("email_verified", False),
                 "email_is_personal": lead.get("email_is_personal", False),
-                "linkedin": lead.get("linkedin"),
+                "linkedin": lead.get("linkedin") or None,
                 "tech_stack": lead.get("tech_stack"),
-                "source_url": lead.get("source_url"),
+                "source_url": lead.get("source_url") or None,
                 "confidence": lead.get("confidence", 0)
             }
             for lead in person_leads
@@ -35,6 +35,7 @@ async def enrich_schools_async(schools_data: list, job_id: str):
     """
     Enrich schools asynchronously and save to Supabase
     """
+    engine = None
     try:
         # Import after path is set
         try:
@@ -99,6 +100,11 @@ async def enrich_schools_async(schools_data: list, job_id: str):
         except:
             pass
         raise
+    finally:
+        # Each invocation runs in its own asyncio.run(); close the engine's
+        # pools before that loop goes away
+        if engine is not None:
+            await engine.aclose()
 
 
 def handler(request):
@@ -1,14 +1,25 @@
 """
 FastAPI main application
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from api.routes import schools, history
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # The module-level enrichment service lives for the whole process;
+    # release its pooled HTTP connections on shutdown
+    await schools.enrichment_service.aclose()
+
+
 app = FastAPI(
     title="Indonesia EdTech Lead Gen API",
     description="API for lead enrichment system",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
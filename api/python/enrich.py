@@ -26,6 +26,7 @@ async def enrich_schools_async(schools_data: list, job_id: str):
         schools_data: List of school dicts with name, type, location
         job_id: Job ID from Supabase
     """
+    engine = None
     try:
         from api.database.supabase import SupabaseDB
         
@@ -87,6 +88,11 @@ async def enrich_schools_async(schools_data: list, job_id: str):
         logger.error(f"Enrichment error: {e}")
         await db.update_job_status(job_id, "failed", str(e))
         raise
+    finally:
+        # Each invocation runs in its own asyncio.run(); close the engine's
+        # pools before that loop goes away
+        if engine is not None:
+            await engine.aclose()
 
 
 def handler(request):
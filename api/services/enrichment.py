@@ -47,4 +47,8 @@ class EnrichmentService:
                 ))
         
         return results
+    
+    async def aclose(self):
+        """Close the engine's connection pools (on application shutdown)"""
+        await self.engine.aclose()
 
@@ -28,12 +28,21 @@ class Config:
     CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-3-5-sonnet-20241022")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     
+    # Token budget for scraped website content sent to the LLM (~4 chars/token)
+    SCRAPED_CONTENT_MAX_TOKENS = int(os.getenv("SCRAPED_CONTENT_MAX_TOKENS", 3000))
+    
     # ===========================================
     # Rate Limiting (REDUCED for speed)
     # ===========================================
     REQUESTS_PER_MINUTE = int(os.getenv("REQUESTS_PER_MINUTE", 60))
     SCRAPE_DELAY_SECONDS = float(os.getenv("SCRAPE_DELAY_SECONDS", 0.5))
     SCHOOL_DELAY_SECONDS = float(os.getenv("SCHOOL_DELAY_SECONDS", 1))
+    # Schools enriched concurrently in a batch (each worker honours the delay)
+    MAX_CONCURRENT_SCHOOLS = int(os.getenv("MAX_CONCURRENT_SCHOOLS", 3))
+    # Serper requests in flight at once (REQUESTS_PER_MINUTE caps the rate)
+    MAX_CONCURRENT_SEARCHES = int(os.getenv("MAX_CONCURRENT_SEARCHES", 32))
+    # Pages fetched in parallel by the scraper (shared across schools)
+    MAX_CONCURRENT_PAGES = int(os.getenv("MAX_CONCURRENT_PAGES", 8))
     
     # ===========================================
     # Scraping Options (REDUCED timeouts)
@@ -41,6 +50,7 @@ class Config:
     MAX_PAGES_PER_SCHOOL = int(os.getenv("MAX_PAGES_PER_SCHOOL", 3))
     REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", 15))
     HEADLESS_BROWSER = os.getenv("HEADLESS_BROWSER", "true").lower() == "true"
+    MAX_PDF_CHARS = int(os.getenv("MAX_PDF_CHARS", 20000))  # Text kept per extracted PDF
     
     # ===========================================
     # Paths
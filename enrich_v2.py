@@ -98,8 +98,6 @@ class EnhancedEnricher:
                 for r in results:
                     if r.url not in [x.url for x in all_results.get(key, [])]:
                         all_results.setdefault(key, []).append(r)
-                
-                await asyncio.sleep(0.3)
         
         return all_results
     
@@ -169,7 +167,7 @@ class EnhancedEnricher:
                     contacts["phones"].extend(self.scraper.extract_all_phone_numbers(page.text_content))
                     
                     # Social media
-                    social = self.scraper.extract_social_media(page.html_content)
+                    social = self.scraper.extract_social_media(page)
                     contacts["social"].update(social)
             
             # Deduplicate
@@ -4,14 +4,40 @@ Supports Claude 3.5 Sonnet (recommended) and GPT-4o-mini
 """
 import json
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 from config import config
-from models import DecisionMaker, SchoolData, RolePriority
+from models import DecisionMaker, SchoolData, RolePriority, ROLE_PRIORITY_ORDER
 import logging
 
+try:
+    from rank_bm25 import BM25Okapi
+    BM25_AVAILABLE = True
+except ImportError:
+    BM25_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ===========================================
+# Passage ranking for scraped content
+# ===========================================
+
+# Tokens that mark a passage as likely to hold people/contact details
+PASSAGE_KEYWORDS = (
+    'kepala', 'kepsek', 'yayasan', 'ketua', 'pembina', 'direktur', 'bendahara',
+    'operator', 'principal', 'director', 'founder', 'chairman',
+    'kontak', 'hubungi', 'contact', 'whatsapp', 'wa.me', 'telp', 'telepon',
+    'email', 'e-mail', 'alamat',
+)
+
+# Static BM25 query (kept constant so the prompt prefix stays cacheable)
+PASSAGE_QUERY = "kepala sekolah kontak whatsapp yayasan ketua direktur email telepon".split()
+
+_PASSAGE_SPLIT = re.compile(r'\n\s*\n')
+_PASSAGE_TOKEN = re.compile(r'\w+')
+_PHONE_HINT = re.compile(r'(?:\+62|\b62|\b0)\d[\d\s\-]{7,13}')
+_EMAIL_HINT = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+
 
 class LLMExtractor:
     """
@@ -70,7 +96,8 @@ class LLMExtractor:
         school_type: str,
         location: str,
         scraped_content: str,
-        search_results: str
+        search_results: str,
+        known_facts: Optional[Dict[str, List[str]]] = None
     ) -> SchoolData:
         """
         Extract complete structured school data from raw content
@@ -81,17 +108,21 @@ class LLMExtractor:
             location: City/region
             scraped_content: Text content from scraped pages
             search_results: Compiled search results text
+            known_facts: Values already found by regex (npsn, email, website, phone)
             
         Returns:
             SchoolData object with extracted information
         """
         from langchain_core.prompts import ChatPromptTemplate
         
+        # Send only the most contact-dense passages to the LLM
+        scraped_content = self._rank_passages(scraped_content)
+        
         prompt = ChatPromptTemplate.from_messages([
             ("system", self._get_system_prompt()),
             ("human", self._get_extraction_prompt(
                 school_name, school_type, location, 
-                scraped_content, search_results
+                scraped_content, search_results, known_facts
             ))
         ])
         
@@ -149,6 +180,83 @@ class LLMExtractor:
                 processing_notes=f"Extraction error: {str(e)}"
             )
     
+    def _rank_passages(self, text: str, max_tokens: int = None) -> str:
+        """
+        Reduce scraped content to its most contact-dense passages
+        
+        Splits on blank lines and scores each passage by contact keywords,
+        phone/email hits and (if rank_bm25 is installed) BM25 against a static
+        query. The best passages are kept until the token budget is spent
+        (approx. 4 chars per token, page headers included) and returned in
+        their original order, each under its page header. A passage larger
+        than the remaining budget is truncated to fit rather than dropped.
+        """
+        if max_tokens is None:
+            max_tokens = config.SCRAPED_CONTENT_MAX_TOKENS
+        
+        if not text or len(text) // 4 <= max_tokens:
+            return text
+        
+        # Split into (page_header, passage) pairs
+        passages = []
+        header = None
+        for chunk in _PASSAGE_SPLIT.split(text):
+            chunk = chunk.strip()
+            if chunk.startswith("=== "):
+                header, _, chunk = chunk.partition("\n")
+                chunk = chunk.strip()
+            if chunk:
+                passages.append((header, chunk))
+        
+        if not passages:
+            return text
+        
+        scores = []
+        for _, chunk in passages:
+            chunk_lower = chunk.lower()
+            score = float(sum(1 for kw in PASSAGE_KEYWORDS if kw in chunk_lower))
+            score += 2.0 * (len(_PHONE_HINT.findall(chunk)) + len(_EMAIL_HINT.findall(chunk)))
+            scores.append(score)
+        
+        if BM25_AVAILABLE:
+            bm25 = BM25Okapi([_PASSAGE_TOKEN.findall(chunk.lower()) for _, chunk in passages])
+            for idx, bm25_score in enumerate(bm25.get_scores(PASSAGE_QUERY)):
+                scores[idx] += bm25_score
+        
+        # Greedily keep the best passages that fit in the budget; a page
+        # header is paid for with the first passage selected under it
+        budget = max_tokens
+        selected = {}
+        paid_headers = set()
+        for idx in sorted(range(len(passages)), key=lambda i: scores[i], reverse=True):
+            header, chunk = passages[idx]
+            header_cost = len(header) // 4 + 1 if header and header not in paid_headers else 0
+            room = budget - header_cost - 1
+            if room <= 0:
+                continue
+            if len(chunk) // 4 > room:
+                # Oversized (e.g. a PDF section without blank lines): keep its head
+                chunk = chunk[:room * 4]
+            selected[idx] = chunk
+            budget -= header_cost + len(chunk) // 4 + 1
+            if header:
+                paid_headers.add(header)
+        
+        if not selected:
+            return text[:max_tokens * 4]
+        
+        parts = []
+        last_header = None
+        for idx in sorted(selected):
+            header = passages[idx][0]
+            chunk = selected[idx]
+            if header and header != last_header:
+                parts.append(header)
+                last_header = header
+            parts.append(chunk)
+        
+        return "\n\n".join(parts)
+    
     def _get_system_prompt(self) -> str:
         """System prompt optimized for Indonesian education sector - PERSONA FOCUSED"""
         return """You are an expert data extraction assistant specializing in the Indonesian education sector.
@@ -240,10 +348,19 @@ Return ONLY valid JSON, no additional text."""
         school_type: str, 
         location: str,
         scraped_content: str,
-        search_results: str
+        search_results: str,
+        known_facts: Optional[Dict[str, List[str]]] = None
     ) -> str:
         """Build the extraction prompt with all available data"""
         
+        # Facts already found by regex, so the LLM doesn't have to rediscover them
+        facts_lines = [
+            f"- {kind}: {', '.join(values)}"
+            for kind, values in (known_facts or {}).items()
+            if values
+        ]
+        facts_text = "\n".join(facts_lines) if facts_lines else "None"
+        
         # Truncate content to fit context window
         scraped_truncated = scraped_content[:12000] if scraped_content else "No content scraped"
         search_truncated = search_results[:6000] if search_results else "No search results"
@@ -251,6 +368,7 @@ Return ONLY valid JSON, no additional text."""
         # Escape curly braces to prevent LangChain template interpretation
         scraped_truncated = scraped_truncated.replace("{", "{{").replace("}", "}}")
         search_truncated = search_truncated.replace("{", "{{").replace("}", "}}")
+        facts_text = facts_text.replace("{", "{{").replace("}", "}}")
         
         # Build prompt without f-string curly braces issues
         prompt = """Extract all available information for this Indonesian school:
@@ -261,6 +379,12 @@ Return ONLY valid JSON, no additional text."""
 
 ---
 
+## PRE-EXTRACTED FACTS (found by pattern matching in search results)
+
+KNOWN_FACTS_PLACEHOLDER
+
+---
+
 ## SEARCH RESULTS
 
 SEARCH_RESULTS_PLACEHOLDER
@@ -333,6 +457,7 @@ Extract as many NAMED individuals as possible. Return ONLY the JSON object."""
         prompt = prompt.replace("SCHOOL_NAME_PLACEHOLDER", school_name)
         prompt = prompt.replace("SCHOOL_TYPE_PLACEHOLDER", school_type)
         prompt = prompt.replace("LOCATION_PLACEHOLDER", location)
+        prompt = prompt.replace("KNOWN_FACTS_PLACEHOLDER", facts_text)
         prompt = prompt.replace("SEARCH_RESULTS_PLACEHOLDER", search_truncated)
         prompt = prompt.replace("SCRAPED_CONTENT_PLACEHOLDER", scraped_truncated)
         
@@ -462,7 +587,7 @@ Return ONLY the JSON array, no other text.""")
                     unique_dms.append(dm)
         
         # Sort by priority
-        unique_dms.sort(key=lambda x: list(RolePriority).index(x.priority))
+        unique_dms.sort(key=lambda x: ROLE_PRIORITY_ORDER[x.priority])
         school_data.decision_makers = unique_dms
         
         # Deduplicate phone numbers
@@ -13,12 +13,16 @@ Usage:
 
 import asyncio
 import argparse
+import csv
+import io
+import json
 import time
+import zipfile
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional
 
-import pandas as pd
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
@@ -31,23 +35,192 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 from models import (
     SchoolInput, SchoolData, DecisionMaker, ProcessingResult, 
-    ProcessingStatus, BatchResult, PersonLead, FoundationCluster
+    ProcessingStatus, BatchResult, PersonLead, FoundationCluster,
+    PERSON_LEAD_COLUMNS, PERSON_LEAD_FIELDS, intern_strings
 )
-from search import SerperSearch, NPSNLookup
-from scraper import WebScraper
-from extractor import LLMExtractor
-from validator import validator
 from schools_data import (
     get_priority_schools, 
     get_all_schools, 
     get_schools_by_location,
+    find_schools_by_name,
     get_school_count,
     print_school_summary
 )
 
+# Heavy modules (pandas, httpx, the search/scrape/LLM pipeline) are imported
+# where they are used, so `--validate` and unmatched `--school` runs start fast
+if TYPE_CHECKING:
+    import httpx
+    import pandas as pd
+
 # Rich console for beautiful output
 console = Console()
 
+# Rows per buffered write in CSV exports
+CSV_CHUNKSIZE = 10000
+
+# Columns of the leads CSV/Excel export (see _prepare_export_rows)
+DM_EXPORT_FIELDS = (
+    "Name", "Role", "LinkedIn", "WhatsApp", "WA Verified",
+    "Email", "Email Verified", "Email Type", "Phone",
+)
+LEAD_EXPORT_COLUMNS = (
+    "School Name", "School Type", "Location", "Foundation Name", "NPSN",
+    "Official Website", "Official Email", "WhatsApp Business", "Phone Numbers",
+    "Instagram", "Facebook",
+    *(f"DM{i} {field}" for i in range(1, 9) for field in DM_EXPORT_FIELDS),
+    "Verified Contacts", "Status", "Data Quality", "Sources", "Last Updated",
+    "Processing Status", "Error",
+)
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop  # libuv event loop (not available on Windows)
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+# ===========================================
+# Shared HTTP client (one pool per batch)
+# ===========================================
+
+_CLIENT: Optional["httpx.AsyncClient"] = None
+
+
+async def get_client() -> "httpx.AsyncClient":
+    """Lazily create the AsyncClient shared by search, NPSN and scraper calls"""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        import httpx
+        _CLIENT = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            trust_env=False
+        )
+    return _CLIENT
+
+
+async def close_client():
+    """Close the shared AsyncClient, if one was created"""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+# ===========================================
+# Streaming XLSX writer (no object model)
+# ===========================================
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{sheet_name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+# Escapes XML specials and drops control characters that XML 1.0 forbids
+_XML_ESCAPE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;',
+    **{chr(c): None for c in range(32) if c not in (9, 10, 13)},
+})
+
+
+def _xlsx_cell(value) -> str:
+    """Render one <c> element (number, inline string, or empty)"""
+    if value is None or value != value:  # None or NaN
+        return '<c/>'
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c><v>{value!r}</v></c>'
+    text = str(value).translate(_XML_ESCAPE)
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def write_xlsx(
+    filepath: Path,
+    columns: List[str],
+    rows: List[dict],
+    widths: List[int],
+    sheet_name: str = "Leads"
+):
+    """
+    Write a single-sheet XLSX by streaming worksheet XML into the zip
+    
+    Skips any spreadsheet object model: each row is rendered straight to
+    XML and pushed through a 1 MiB buffer, so memory stays flat.
+    """
+    with zipfile.ZipFile(filepath, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+        zf.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+        zf.writestr('xl/workbook.xml', _XLSX_WORKBOOK.format(
+            sheet_name=sheet_name.translate(_XML_ESCAPE)
+        ))
+        zf.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+        
+        with zf.open('xl/worksheets/sheet1.xml', 'w') as raw:
+            out = io.BufferedWriter(raw, buffer_size=1 << 20)
+            out.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            )
+            
+            if widths:
+                out.write(b'<cols>')
+                for idx, width in enumerate(widths, 1):
+                    out.write(f'<col min="{idx}" max="{idx}" width="{width}" customWidth="1"/>'.encode())
+                out.write(b'</cols>')
+            
+            out.write(b'<sheetData>')
+            header = ''.join(_xlsx_cell(col) for col in columns)
+            out.write(f'<row r="1">{header}</row>'.encode('utf-8'))
+            for row_idx, row in enumerate(rows, 2):
+                cells = ''.join(_xlsx_cell(row.get(col)) for col in columns)
+                out.write(f'<row r="{row_idx}">{cells}</row>'.encode('utf-8'))
+            out.write(b'</sheetData></worksheet>')
+            
+            out.flush()
+            out.detach()
+
 
 class LeadEnrichmentEngine:
     """
@@ -62,6 +235,12 @@ class LeadEnrichmentEngine:
     """
     
     def __init__(self):
+        from search import SerperSearch, NPSNLookup
+        from scraper import WebScraper
+        from extractor import LLMExtractor
+        from validator import validator
+        
+        self.validator = validator
         self.search = SerperSearch()
         self.scraper = WebScraper()
         self.extractor = LLMExtractor()
@@ -70,10 +249,18 @@ class LeadEnrichmentEngine:
         # Ensure output directory exists
         config.OUTPUT_DIR.mkdir(exist_ok=True)
     
-    async def enrich_school(self, school: SchoolInput) -> ProcessingResult:
+    async def enrich_school(
+        self, 
+        school: SchoolInput,
+        timestamp: Optional[str] = None
+    ) -> ProcessingResult:
         """
         Full enrichment pipeline for a single school
         
+        Args:
+            school: School to enrich
+            timestamp: ISO timestamp for last_updated (shared across a batch)
+        
         Returns ProcessingResult with status and data
         """
         start_time = time.time()
@@ -105,9 +292,17 @@ class LeadEnrichmentEngine:
             result.search_results_count = sum(len(r) for r in search_results.values())
             search_text = self.search.compile_results_text(search_results)
             
+            # One pass over the search text for NPSN/phones/emails/websites
+            search_facts = self.search.extract_facts(search_text)
+            
             # Find official website and NPSN from search results
-            official_url = self.search.find_official_website(search_results)
-            npsn = self.npsn_lookup.extract_npsn_from_text(search_text)
+            # (website, profiles and bio links classified in one walk)
+            classified = self.search.classify_results(search_results)
+            official_url = classified["official_website"]
+            if search_facts["npsn"]:
+                npsn = search_facts["npsn"][0]
+            else:
+                npsn = self.npsn_lookup.extract_npsn_from_text(search_text)
             
             if official_url:
                 console.print(f"  🌐 Found website: {official_url}")
@@ -138,7 +333,7 @@ class LeadEnrichmentEngine:
             social_media = {}
             
             # NEW: Find Linktree/Bio URLs from search results
-            linktree_urls = self.search.find_linktree_urls(search_results)
+            linktree_urls = classified["linktree"]
             linktree_whatsapp = {}
             
             if linktree_urls:
@@ -164,11 +359,14 @@ class LeadEnrichmentEngine:
                     console.print(f"  🖥️ Detected tech stack: {', '.join(tech_stack)}")
                 
                 # NEW: Find and extract structure PDFs
-                pdf_links = self.scraper.find_pdf_links(pages)
-                for pdf_url in pdf_links[:2]:  # Limit to 2 PDFs
-                    pdf_text = await self.scraper.extract_pdf_text(pdf_url)
+                pdf_links = self.scraper.find_pdf_links(pages)[:2]  # Limit to 2 PDFs
+                pdf_texts = await asyncio.gather(
+                    *(self.scraper.extract_pdf_text(pdf_url) for pdf_url in pdf_links)
+                )
+                for pdf_url, pdf_text in zip(pdf_links, pdf_texts):
                     if pdf_text:
-                        scraped_content += f"\n\n=== PDF: {pdf_url} ===\n{pdf_text}"
+                        # Cap PDF text so a large document can't crowd out the pages
+                        scraped_content += f"\n\n=== PDF: {pdf_url} ===\n{pdf_text[:config.MAX_PDF_CHARS]}"
                 
                 for page in pages:
                     if page.success:
@@ -179,10 +377,10 @@ class LeadEnrichmentEngine:
                         whatsapp_numbers.extend(
                             self.scraper.extract_whatsapp_links(page.text_content + page.html_content)
                         )
-                        emails.extend(self.scraper.extract_emails(page.text_content))
+                        emails.extend(self.scraper.extract_emails(page.text_lower))
                         
                         # Extract social media
-                        page_social = self.scraper.extract_social_media(page.html_content)
+                        page_social = self.scraper.extract_social_media(page)
                         social_media.update(page_social)
             
             # ===========================================
@@ -196,7 +394,8 @@ class LeadEnrichmentEngine:
                 school_type=school.type,
                 location=school.location,
                 scraped_content=scraped_content,
-                search_results=search_text
+                search_results=search_text,
+                known_facts=search_facts
             )
             
             # ===========================================
@@ -221,14 +420,14 @@ class LeadEnrichmentEngine:
             
             # Set primary WhatsApp
             if all_whatsapp and not school_data.whatsapp_business:
-                school_data.whatsapp_business = list(all_whatsapp)[0]
+                school_data.whatsapp_business = next(iter(all_whatsapp))
             
             # Merge emails
             all_emails = set(emails)
             if school_data.official_email:
                 all_emails.add(school_data.official_email)
             if all_emails and not school_data.official_email:
-                school_data.official_email = list(all_emails)[0]
+                school_data.official_email = next(iter(all_emails))
             
             # Add social media
             if not school_data.instagram and social_media.get('instagram'):
@@ -238,11 +437,11 @@ class LeadEnrichmentEngine:
             
             # NEW: Add tech stack
             if tech_stack:
-                school_data.tech_stack = tech_stack
+                school_data.tech_stack = intern_strings(tech_stack)
             
             # Add source URLs
-            school_data.source_urls = list(set(source_urls))
-            school_data.last_updated = datetime.now().isoformat()
+            school_data.source_urls = intern_strings(source_urls)
+            school_data.last_updated = timestamp or datetime.now().isoformat()
             
             # NEW: Add Google Maps phone if found
             if google_maps_data and google_maps_data.get("phone"):
@@ -263,30 +462,33 @@ class LeadEnrichmentEngine:
                 # Validate decision makers
                 for dm in school_data.decision_makers:
                     if config.VALIDATE_WHATSAPP and dm.whatsapp:
-                        wa_result = await validator.verify_whatsapp(
+                        wa_result = await self.validator.verify_whatsapp(
                             dm.whatsapp,
                             use_api=config.USE_WHATSAPP_API
                         )
                         dm.whatsapp_verified = wa_result.get("exists", False)
+                
+                # Verify all emails together (one MX/SMTP check per domain);
+                # the school-level email rides along in the same batch
+                if config.VALIDATE_EMAIL:
+                    email_dms = [dm for dm in school_data.decision_makers if dm.email]
+                    emails = [dm.email for dm in email_dms]
+                    if school_data.official_email:
+                        emails.append(school_data.official_email)
+                    email_results = await self.validator.verify_emails(emails)
                     
-                    if config.VALIDATE_EMAIL and dm.email:
-                        email_result = await validator.verify_email_live(dm.email)
+                    for dm, email_result in zip(email_dms, email_results):
                         dm.email_verified = email_result.get("is_live", False)
                         dm.email_is_personal = email_result.get("is_personal", False)
                 
                 # Validate school-level WhatsApp
                 if config.VALIDATE_WHATSAPP and school_data.whatsapp_business:
-                    wa_result = await validator.verify_whatsapp(
+                    wa_result = await self.validator.verify_whatsapp(
                         school_data.whatsapp_business,
                         use_api=config.USE_WHATSAPP_API
                     )
                     # Could store in a new field if needed
                 
-                # Validate school-level email
-                if config.VALIDATE_EMAIL and school_data.official_email:
-                    email_result = await validator.verify_email_live(school_data.official_email)
-                    # Could store in a new field if needed
-                
                 # Recalculate quality score with verification bonus
                 school_data.calculate_quality_score()
             
@@ -320,50 +522,119 @@ class LeadEnrichmentEngine:
     async def enrich_batch(
         self, 
         schools: List[SchoolInput],
-        delay_between_schools: float = None
+        delay_between_schools: float = None,
+        concurrency: int = None,
+        on_complete: Optional[Callable[[ProcessingResult], None]] = None
     ) -> BatchResult:
         """
         Process a batch of schools with progress tracking
+        
+        Schools are fed through a bounded queue to a pool of workers, so
+        one school's LLM extraction overlaps with the next one's search
+        and scraping. The delay applies per worker, between its schools.
+        Results keep the input order.
+        
+        If `on_complete` is given it receives each result as soon as it
+        finishes and results are not kept in `BatchResult.results`
+        (see StreamingExporter).
         """
         if delay_between_schools is None:
             delay_between_schools = config.SCHOOL_DELAY_SECONDS
+        if concurrency is None:
+            concurrency = config.MAX_CONCURRENT_SCHOOLS
+        concurrency = max(1, min(concurrency, len(schools)))
+        
+        # One timestamp for the whole batch
+        batch_now = datetime.now().isoformat()
         
         batch_result = BatchResult(
             total_schools=len(schools),
             successful=0,
             failed=0,
             results=[],
-            started_at=datetime.now().isoformat()
+            started_at=batch_now
         )
         
         start_time = time.time()
         
         console.print(Panel.fit(
             f"[bold]Processing {len(schools)} schools[/bold]\n"
-            f"Delay between schools: {delay_between_schools}s",
+            f"Delay between schools: {delay_between_schools}s\n"
+            f"Concurrent workers: {concurrency}",
             title="🇮🇩 Indonesia EdTech Lead Gen Engine"
         ))
         
-        for i, school in enumerate(schools, 1):
-            console.print(f"\n📊 [bold]Progress:[/bold] {i}/{len(schools)}")
-            
-            result = await self.enrich_school(school)
-            batch_result.results.append(result)
-            
-            if result.status == ProcessingStatus.COMPLETED:
-                batch_result.successful += 1
-            else:
-                batch_result.failed += 1
-            
-            # Delay between schools (except for last one)
-            if i < len(schools):
-                await asyncio.sleep(delay_between_schools)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        results: List[Optional[ProcessingResult]] = [None] * len(schools)
+        started = 0
+        
+        async def feed():
+            for item in enumerate(schools):
+                await queue.put(item)
+            for _ in range(concurrency):
+                await queue.put(None)
+        
+        async def worker():
+            nonlocal started
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                index, school = item
+                started += 1
+                console.print(f"\n📊 [bold]Progress:[/bold] {started}/{len(schools)}")
+                
+                result = await self.enrich_school(school, timestamp=batch_now)
+                if on_complete is not None:
+                    on_complete(result)
+                else:
+                    results[index] = result
+                
+                if result.status == ProcessingStatus.COMPLETED:
+                    batch_result.successful += 1
+                else:
+                    batch_result.failed += 1
+                
+                # Per-worker delay (skipped once every school is taken)
+                if started < len(schools):
+                    await asyncio.sleep(delay_between_schools)
+        
+        client = await get_client()
+        self.search.client = self.npsn_lookup.client = self.scraper.client = client
+        try:
+            # One browser / crawler session for the whole batch
+            async with self.scraper:
+                tasks = [asyncio.ensure_future(feed())]
+                tasks += [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+                try:
+                    await asyncio.gather(*tasks)
+                finally:
+                    # If one task failed (e.g. on_complete raised), stop the
+                    # others before the scraper session and client close
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.search.client = self.npsn_lookup.client = self.scraper.client = None
+            await close_client()
+        batch_result.results = [r for r in results if r is not None]
         
         batch_result.completed_at = datetime.now().isoformat()
         batch_result.total_time_seconds = time.time() - start_time
         
         return batch_result
     
+    async def aclose(self):
+        """
+        Close the search and NPSN connection pools opened by enrich_school
+        
+        enrich_batch injects (and closes) one shared client; callers that use
+        enrich_school directly own these pools and must call this when done,
+        from the event loop that used them.
+        """
+        await self.search.aclose()
+        await self.npsn_lookup.aclose()
+    
     def export_to_csv(
         self, 
         results: List[ProcessingResult], 
@@ -375,10 +646,11 @@ class LeadEnrichmentEngine:
             filename = f"leads_{timestamp}.csv"
         
         filepath = config.OUTPUT_DIR / filename
-        rows = self._prepare_export_rows(results)
+        import pandas as pd
         
-        df = pd.DataFrame(rows)
-        df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        rows = self._prepare_export_rows(results)
+        df = pd.DataFrame.from_records(rows)
+        df.to_csv(filepath, index=False, encoding='utf-8-sig', chunksize=CSV_CHUNKSIZE)
         
         console.print(f"💾 [green]Exported to:[/green] {filepath}")
         return str(filepath)
@@ -394,27 +666,76 @@ class LeadEnrichmentEngine:
             filename = f"leads_{timestamp}.xlsx"
         
         filepath = config.OUTPUT_DIR / filename
-        rows = self._prepare_export_rows(results)
+        import pandas as pd
         
+        rows = self._prepare_export_rows(results)
         df = pd.DataFrame(rows)
+        widths = self._column_widths(df)
         
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Leads', index=False)
+        try:
+            import xlsxwriter
+        except ImportError:
+            # Fallback: stream the sheet XML ourselves
+            write_xlsx(filepath, list(df.columns), df.to_dict('records'), widths)
+        else:
+            # constant_memory streams rows to disk as they are written. Rows must
+            # be written in order, so write them directly rather than through
+            # df.to_excel (which emits cells column by column).
+            workbook = xlsxwriter.Workbook(str(filepath), {'constant_memory': True})
+            worksheet = workbook.add_worksheet('Leads')
+            
+            for idx, width in enumerate(widths):
+                worksheet.set_column(idx, idx, width)
             
-            # Auto-adjust column widths using openpyxl utility
-            from openpyxl.utils import get_column_letter
-            worksheet = writer.sheets['Leads']
-            for idx, col in enumerate(df.columns, 1):  # 1-indexed for openpyxl
-                max_len = max(
-                    df[col].astype(str).apply(len).max(),
-                    len(col)
-                ) + 2
-                col_letter = get_column_letter(idx)
-                worksheet.column_dimensions[col_letter].width = min(max_len, 50)
+            worksheet.write_row(0, 0, list(df.columns), workbook.add_format({'bold': True}))
+            
+            values = df.astype(object).where(df.notna(), None)
+            for row_idx, row in enumerate(values.itertuples(index=False, name=None), 1):
+                worksheet.write_row(row_idx, 0, row)
+            
+            workbook.close()
         
         console.print(f"💾 [green]Exported to:[/green] {filepath}")
         return str(filepath)
     
+    def export_to_excel_fast(
+        self, 
+        results: List[ProcessingResult], 
+        filename: str = None
+    ) -> str:
+        """
+        Export results to Excel by writing the XLSX XML directly
+        
+        No DataFrame or workbook object model - suited to very large exports
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"leads_{timestamp}.xlsx"
+        
+        filepath = config.OUTPUT_DIR / filename
+        rows = self._prepare_export_rows(results)
+        
+        # Union of row keys in first-seen order (same as DataFrame columns)
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        max_lens = dict.fromkeys(columns, 0)
+        for row in rows:
+            for key, value in row.items():
+                max_lens[key] = max(max_lens[key], len(str(value)))
+        widths = [min(max(max_lens[col], len(col)) + 2, 50) for col in columns]
+        
+        write_xlsx(filepath, columns, rows, widths)
+        
+        console.print(f"💾 [green]Exported to:[/green] {filepath}")
+        return str(filepath)
+    
+    def _column_widths(self, df: "pd.DataFrame") -> List[int]:
+        """Excel column widths: longest value (or header) + 2, capped at 50"""
+        max_lens = df.astype(str).apply(lambda col: col.str.len().max()).fillna(0)
+        return [
+            min(max(int(max_len), len(str(col))) + 2, 50)
+            for col, max_len in max_lens.items()
+        ]
+    
     def _prepare_export_rows(self, results: List[ProcessingResult]) -> List[dict]:
         """Prepare rows for export"""
         rows = []
@@ -507,37 +828,74 @@ class LeadEnrichmentEngine:
     # NEW: Person-Centric Export
     # ===========================================
     
+    def _person_leads(
+        self, 
+        results: List[ProcessingResult]
+    ) -> Dict[int, List[PersonLead]]:
+        """
+        Build PersonLeads (named decision makers only) once per result
+        
+        Keyed by id(result); the caller's results list keeps every result
+        alive, so ids stay unique while the mapping is used. Build it once
+        per export batch and pass it as `person_leads` to
+        export_person_leads, export_person_leads_json and
+        cluster_by_foundation / export_foundation_clusters.
+        """
+        return {
+            id(result): self._build_person_leads(result.school_data)
+            for result in results
+            if result.school_data
+        }
+    
+    @staticmethod
+    def _build_person_leads(school_data: SchoolData) -> List[PersonLead]:
+        """PersonLeads for a school's named decision makers"""
+        return [
+            PersonLead.from_decision_maker(dm, school_data)
+            for dm in school_data.decision_makers
+            if dm.name  # Only include named people
+        ]
+    
     def export_person_leads(
         self, 
         results: List[ProcessingResult], 
-        filename: str = None
+        filename: str = None,
+        person_leads: Optional[Dict[int, List[PersonLead]]] = None
     ) -> str:
         """
         Export person-centric leads (one row per person)
         
         This is the new output format optimized for B2B outreach
+        
+        person_leads: optional _person_leads(results), shared across exports
         """
+        if person_leads is None:
+            person_leads = self._person_leads(results)
+        
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"person_leads_{timestamp}.csv"
         
         filepath = config.OUTPUT_DIR / filename
-        person_leads = []
-        
-        for result in results:
-            if result.school_data:
-                for dm in result.school_data.decision_makers:
-                    if dm.name:  # Only include named people
-                        lead = PersonLead.from_decision_maker(dm, result.school_data)
-                        person_leads.append(lead.to_dict())
+        rows = [
+            lead.to_row()
+            for leads in person_leads.values()
+            for lead in leads
+        ]
         
-        df = pd.DataFrame(person_leads)
-        
-        # Sort by Priority Tier (1 = highest priority)
-        if not df.empty:
-            df = df.sort_values(['Priority Tier', 'School Name'])
+        return self._write_person_leads_csv(filepath, rows)
+    
+    def _write_person_leads_csv(self, filepath: Path, person_leads: List[tuple]) -> str:
+        """Write PersonLead.to_row() tuples, sorted by tier then school"""
+        # Sort by Priority Tier (1 = highest priority), then School Name
+        tier = PERSON_LEAD_FIELDS.index("priority_tier")
+        name = PERSON_LEAD_FIELDS.index("school_name")
+        person_leads.sort(key=lambda row: (row[tier], row[name]))
         
-        df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(PERSON_LEAD_COLUMNS)
+            writer.writerows(person_leads)
         
         console.print(f"💾 [green]Person leads exported to:[/green] {filepath}")
         console.print(f"   Total people: {len(person_leads)}")
@@ -547,27 +905,36 @@ class LeadEnrichmentEngine:
     def export_person_leads_json(
         self, 
         results: List[ProcessingResult], 
-        filename: str = None
+        filename: str = None,
+        person_leads: Optional[Dict[int, List[PersonLead]]] = None
     ) -> str:
-        """Export person leads as JSON"""
-        import json
+        """Export person leads as JSON (person_leads as in export_person_leads)"""
+        if person_leads is None:
+            person_leads = self._person_leads(results)
         
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"person_leads_{timestamp}.json"
         
         filepath = config.OUTPUT_DIR / filename
-        person_leads = []
+        records = [
+            lead.to_dict()
+            for leads in person_leads.values()
+            for lead in leads
+        ]
         
-        for result in results:
-            if result.school_data:
-                for dm in result.school_data.decision_makers:
-                    if dm.name:
-                        lead = PersonLead.from_decision_maker(dm, result.school_data)
-                        person_leads.append(lead.to_dict())
+        return self._write_person_leads_json(filepath, records)
+    
+    def _write_person_leads_json(self, filepath: Path, person_leads: List[dict]) -> str:
+        """Write PersonLead.to_dict() records as a JSON array"""
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(person_leads, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(person_leads, ensure_ascii=False, indent=2).encode('utf-8')
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(person_leads, f, ensure_ascii=False, indent=2)
+        # Both serializers produce UTF-8 bytes, so write in binary mode
+        with open(filepath, 'wb') as f:
+            f.write(data)
         
         console.print(f"💾 [green]Person leads JSON exported to:[/green] {filepath}")
         return str(filepath)
@@ -578,72 +945,64 @@ class LeadEnrichmentEngine:
     
     def cluster_by_foundation(
         self, 
-        results: List[ProcessingResult]
+        results: List[ProcessingResult],
+        person_leads: Optional[Dict[int, List[PersonLead]]] = None
     ) -> List[FoundationCluster]:
         """
         Group schools by their foundation/Yayasan
         
         This helps identify opportunities where one contact 
         can open doors to multiple schools
+        
+        person_leads: optional _person_leads(results), shared across exports
         """
-        from collections import defaultdict
-        
-        # Group schools by foundation name
-        foundation_schools = defaultdict(list)
-        foundation_data = defaultdict(lambda: {
-            "schools": [],
-            "contacts": [],
-            "tech_stacks": set(),
-            "has_whatsapp": False,
-            "has_linkedin": False,
-        })
+        if person_leads is None:
+            person_leads = self._person_leads(results)
         
+        # Single pass: each school is folded into its foundation's cluster
+        clusters: Dict[str, FoundationCluster] = {}
+        tech_counts: Dict[str, Counter] = {}
         for result in results:
-            if result.school_data:
-                data = result.school_data
-                foundation_name = data.foundation_name or "Unknown Foundation"
-                
-                foundation_data[foundation_name]["schools"].append(data.school_name)
-                
-                # Aggregate contacts
-                for dm in data.decision_makers:
-                    if dm.name:
-                        lead = PersonLead.from_decision_maker(dm, data)
-                        foundation_data[foundation_name]["contacts"].append(lead)
-                        
-                        if dm.whatsapp:
-                            foundation_data[foundation_name]["has_whatsapp"] = True
-                        if dm.linkedin_url:
-                            foundation_data[foundation_name]["has_linkedin"] = True
-                
-                # Aggregate tech stacks
-                for tech in data.tech_stack:
-                    foundation_data[foundation_name]["tech_stacks"].add(tech)
-        
-        # Create FoundationCluster objects
-        clusters = []
-        for foundation_name, data in foundation_data.items():
-            cluster = FoundationCluster(
-                foundation_name=foundation_name,
-                schools=data["schools"],
-                total_schools=len(data["schools"]),
-                foundation_contacts=data["contacts"],
-                total_decision_makers=len(data["contacts"]),
-                has_whatsapp=data["has_whatsapp"],
-                has_linkedin=data["has_linkedin"],
-                common_tech_stack=list(data["tech_stacks"]),
-            )
-            clusters.append(cluster)
+            if not result.school_data:
+                continue
+            
+            data = result.school_data
+            foundation_name = data.foundation_name or "Unknown Foundation"
+            cluster = clusters.get(foundation_name)
+            if cluster is None:
+                # Built from validated SchoolData, so skip re-validation
+                cluster = clusters[foundation_name] = FoundationCluster.model_construct(
+                    foundation_name=foundation_name
+                )
+                tech_counts[foundation_name] = Counter()
+            
+            leads = person_leads[id(result)]
+            cluster.schools.append(data.school_name)
+            cluster.foundation_contacts.extend(leads)
+            if not cluster.has_whatsapp:
+                cluster.has_whatsapp = any(lead.direct_whatsapp for lead in leads)
+            if not cluster.has_linkedin:
+                cluster.has_linkedin = any(lead.linkedin for lead in leads)
+            tech_counts[foundation_name].update(data.tech_stack)
         
-        # Sort by number of schools (larger foundations first)
-        clusters.sort(key=lambda x: x.total_schools, reverse=True)
+        for foundation_name, cluster in clusters.items():
+            cluster.total_schools = len(cluster.schools)
+            cluster.total_decision_makers = len(cluster.foundation_contacts)
+            # "Common" = used by at least half of the foundation's schools
+            threshold = cluster.total_schools * 0.5
+            cluster.common_tech_stack = [
+                tech for tech, count in tech_counts[foundation_name].items()
+                if count >= threshold
+            ]
         
-        return clusters
+        # Sort by number of schools (larger foundations first)
+        return sorted(clusters.values(), key=lambda x: x.total_schools, reverse=True)
     
     def export_foundation_clusters(
         self, 
         results: List[ProcessingResult], 
-        filename: str = None
+        filename: str = None,
+        person_leads: Optional[Dict[int, List[PersonLead]]] = None
     ) -> str:
         """Export foundation clusters to CSV"""
         if filename is None:
@@ -651,7 +1010,7 @@ class LeadEnrichmentEngine:
             filename = f"foundation_clusters_{timestamp}.csv"
         
         filepath = config.OUTPUT_DIR / filename
-        clusters = self.cluster_by_foundation(results)
+        clusters = self.cluster_by_foundation(results, person_leads)
         
         rows = []
         for cluster in clusters:
@@ -665,6 +1024,7 @@ class LeadEnrichmentEngine:
                 "Tech Stack": ", ".join(cluster.common_tech_stack),
             })
         
+        import pandas as pd
         df = pd.DataFrame(rows)
         df.to_csv(filepath, index=False, encoding='utf-8-sig')
         
@@ -685,18 +1045,13 @@ class LeadEnrichmentEngine:
             title="📊 Summary"
         ))
         
-        # Decision makers found
-        total_dms = sum(
-            len(r.school_data.decision_makers) 
-            for r in batch_result.results 
-            if r.school_data
-        )
+        # Streamed batches keep their results in the NDJSON log only
+        results = batch_result.results
+        if not results and batch_result.results_log:
+            results = iter_logged_results(batch_result.results_log)
         
-        # WhatsApp found
-        wa_count = sum(
-            1 for r in batch_result.results 
-            if r.school_data and r.school_data.whatsapp_business
-        )
+        total_dms = 0   # Decision makers found
+        wa_count = 0    # WhatsApp found
         
         # Create results table
         table = Table(title="Results Overview")
@@ -706,9 +1061,11 @@ class LeadEnrichmentEngine:
         table.add_column("WhatsApp", justify="center")
         table.add_column("Quality", justify="center")
         
-        for result in batch_result.results:
+        for result in results:
             if result.school_data:
                 dm_count = len(result.school_data.decision_makers)
+                total_dms += dm_count
+                wa_count += bool(result.school_data.whatsapp_business)
                 wa = "✓" if result.school_data.whatsapp_business else "✗"
                 quality = f"{result.school_data.data_quality_score:.0%}"
                 status = "[green]✓[/green]"
@@ -733,6 +1090,194 @@ class LeadEnrichmentEngine:
         console.print(f"   Schools with WhatsApp: {wa_count}/{batch_result.total_schools}")
 
 
+def iter_logged_results(path) -> Iterator[ProcessingResult]:
+    """Read back the ProcessingResults written by StreamingExporter"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield ProcessingResult.model_validate_json(line)
+
+
+class StreamingExporter:
+    """
+    Write each school's result to disk as soon as it completes
+    
+    Passed to enrich_batch as `on_complete`, so a batch never holds every
+    ProcessingResult in memory:
+    - every result is appended to an NDJSON log (results_<ts>.ndjson),
+      which print_summary and the cluster export read back
+    - leads CSV and Excel rows are written as they arrive
+    - person leads are built once per school: kept as small row tuples for
+      the person-lead files, and as PersonLeads only if clusters are exported
+    
+    Use as a context manager; files are finalized on exit. If no school
+    completed successfully, the export files are discarded (as the batch
+    export always did) and only the results log is kept.
+    """
+    
+    def __init__(
+        self,
+        engine: LeadEnrichmentEngine,
+        timestamp: str,
+        output: str = "both",
+        person_leads: bool = False,
+        clusters: bool = False
+    ):
+        self.engine = engine
+        self.timestamp = timestamp
+        self.write_csv = output in ["csv", "both", "all"]
+        self.write_excel = output in ["excel", "both", "all"]
+        self.write_person_leads = person_leads or output == "all"
+        self.write_clusters = clusters or output == "all"
+        
+        self.log_path = config.OUTPUT_DIR / f"results_{timestamp}.ndjson"
+        self.csv_path = config.OUTPUT_DIR / f"leads_{timestamp}.csv"
+        self.excel_path = config.OUTPUT_DIR / f"leads_{timestamp}.xlsx"
+        
+        self._person_rows: List[tuple] = []
+        # Leads of each logged result with school_data, in log order
+        self._school_leads: List[List[PersonLead]] = []
+        self._widths = [len(col) for col in LEAD_EXPORT_COLUMNS]
+        self._excel_rows = 0
+        self.successful = 0
+    
+    def __enter__(self):
+        config.OUTPUT_DIR.mkdir(exist_ok=True)
+        self._log = open(self.log_path, 'w', encoding='utf-8')
+        
+        self._csv_file = self._csv = None
+        if self.write_csv:
+            self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8-sig')
+            self._csv = csv.DictWriter(
+                self._csv_file, fieldnames=LEAD_EXPORT_COLUMNS,
+                restval="", lineterminator='\n'
+            )
+            self._csv.writeheader()
+        
+        self._workbook = self._worksheet = None
+        if self.write_excel:
+            try:
+                import xlsxwriter
+            except ImportError:
+                pass  # write_xlsx from the log on close
+            else:
+                self._workbook = xlsxwriter.Workbook(
+                    str(self.excel_path), {'constant_memory': True}
+                )
+                self._worksheet = self._workbook.add_worksheet('Leads')
+                self._worksheet.write_row(
+                    0, 0, LEAD_EXPORT_COLUMNS, self._workbook.add_format({'bold': True})
+                )
+        return self
+    
+    def __call__(self, result: ProcessingResult):
+        """on_complete callback: export one finished school"""
+        self._log.write(result.model_dump_json())
+        self._log.write('\n')
+        if result.status == ProcessingStatus.COMPLETED:
+            self.successful += 1
+        
+        row = self.engine._prepare_export_rows([result])[0]
+        if self._csv is not None:
+            self._csv.writerow(row)
+        if self.write_excel:
+            values = [row.get(col) for col in LEAD_EXPORT_COLUMNS]
+            for idx, value in enumerate(values):
+                if value is not None:
+                    self._widths[idx] = max(self._widths[idx], len(str(value)))
+            if self._worksheet is not None:
+                self._excel_rows += 1
+                self._worksheet.write_row(self._excel_rows, 0, values)
+        
+        if (self.write_person_leads or self.write_clusters) and result.school_data:
+            leads = self.engine._build_person_leads(result.school_data)
+            if self.write_person_leads:
+                self._person_rows.extend(lead.to_row() for lead in leads)
+            if self.write_clusters:
+                self._school_leads.append(leads)
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._log.close()
+        widths = [min(width + 2, 50) for width in self._widths]
+        
+        if not self.successful:
+            # Nothing worth exporting: drop the streamed files
+            if self._csv_file is not None:
+                self._csv_file.close()
+                self.csv_path.unlink(missing_ok=True)
+            if self._workbook is not None:
+                self._workbook.close()
+                self.excel_path.unlink(missing_ok=True)
+            console.print(f"📝 [green]Results log:[/green] {self.log_path}")
+            return False
+        
+        if self._csv_file is not None:
+            self._csv_file.close()
+            console.print(f"💾 [green]Exported to:[/green] {self.csv_path}")
+        
+        if self.write_excel:
+            if self._workbook is not None:
+                for idx, width in enumerate(widths):
+                    self._worksheet.set_column(idx, idx, width)
+                self._workbook.close()
+            else:
+                rows = (
+                    row
+                    for result in iter_logged_results(self.log_path)
+                    for row in self.engine._prepare_export_rows([result])
+                )
+                write_xlsx(self.excel_path, list(LEAD_EXPORT_COLUMNS), rows, widths)
+            console.print(f"💾 [green]Exported to:[/green] {self.excel_path}")
+        
+        if self.write_person_leads:
+            records = [dict(zip(PERSON_LEAD_COLUMNS, row)) for row in self._person_rows]
+            self.engine._write_person_leads_json(
+                config.OUTPUT_DIR / f"person_leads_{self.timestamp}.json", records
+            )
+            self.engine._write_person_leads_csv(
+                config.OUTPUT_DIR / f"person_leads_{self.timestamp}.csv", self._person_rows
+            )
+        
+        if self.write_clusters:
+            # Clustering needs every school at once; read it back from the log
+            # and pair each school with the leads already built for it
+            results = list(iter_logged_results(self.log_path))
+            person_leads = {
+                id(result): leads
+                for result, leads in zip(
+                    (r for r in results if r.school_data), self._school_leads
+                )
+            }
+            self.engine.export_foundation_clusters(
+                results,
+                f"foundation_clusters_{self.timestamp}.csv",
+                person_leads
+            )
+        
+        console.print(f"📝 [green]Results log:[/green] {self.log_path}")
+        return False
+
+
+def print_config_errors(errors: List[str]):
+    """Print configuration errors with a hint about the .env file"""
+    console.print("\n[red]❌ Configuration errors:[/red]")
+    for error in errors:
+        console.print(f"   • {error}")
+    console.print("\nPlease check your .env file and try again.")
+    console.print("Copy env.example to .env and fill in your API keys.")
+
+
+def validate_and_exit():
+    """Handle --validate: check the configuration, show the school database"""
+    errors = Config.validate()
+    if errors:
+        print_config_errors(errors)
+        return
+    
+    console.print("\n[green]✓ Configuration is valid![/green]")
+    print_school_summary()
+
+
 async def main():
     """Main entry point with CLI argument parsing"""
     parser = argparse.ArgumentParser(
@@ -812,31 +1357,26 @@ Examples:
     
     args = parser.parse_args()
     
-    # Print header
-    console.print("\n" + "=" * 60)
-    console.print("[bold blue]🇮🇩 Indonesia EdTech Lead Gen Engine[/bold blue]")
-    console.print("=" * 60)
+    # --validate only needs Config; no header, no engine
+    if args.validate:
+        validate_and_exit()
+        return
     
     # Validate configuration
     errors = Config.validate()
     if errors:
-        console.print("\n[red]❌ Configuration errors:[/red]")
-        for error in errors:
-            console.print(f"   • {error}")
-        console.print("\nPlease check your .env file and try again.")
-        console.print("Copy env.example to .env and fill in your API keys.")
+        print_config_errors(errors)
         return
     
-    if args.validate:
-        console.print("\n[green]✓ Configuration is valid![/green]")
-        print_school_summary()
-        return
+    # Print header
+    console.print("\n" + "=" * 60)
+    console.print("[bold blue]🇮🇩 Indonesia EdTech Lead Gen Engine[/bold blue]")
+    console.print("=" * 60)
     
     # Determine which schools to process
     if args.school:
-        # Single school
-        all_schools = get_all_schools()
-        matching = [s for s in all_schools if args.school.lower() in s.name.lower()]
+        # Single school (only matching rows are turned into SchoolInput)
+        matching = find_schools_by_name(args.school)
         if not matching:
             console.print(f"[red]School not found: {args.school}[/red]")
             return
@@ -859,32 +1399,22 @@ Examples:
     
     console.print(f"\n📚 Schools to process: {len(schools)}")
     
-    # Initialize engine and process
+    # Initialize engine and process, exporting each school as it completes
     engine = LeadEnrichmentEngine()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    batch_result = await engine.enrich_batch(
-        schools=schools,
-        delay_between_schools=args.delay
-    )
-    
-    # Export results
-    if batch_result.successful > 0:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        if args.output in ["csv", "both", "all"]:
-            engine.export_to_csv(batch_result.results, f"leads_{timestamp}.csv")
-        
-        if args.output in ["excel", "both", "all"]:
-            engine.export_to_excel(batch_result.results, f"leads_{timestamp}.xlsx")
-        
-        # NEW: Person-centric leads export
-        if args.person_leads or args.output == "all":
-            engine.export_person_leads(batch_result.results, f"person_leads_{timestamp}.csv")
-            engine.export_person_leads_json(batch_result.results, f"person_leads_{timestamp}.json")
-        
-        # NEW: Foundation clusters export
-        if args.clusters or args.output == "all":
-            engine.export_foundation_clusters(batch_result.results, f"foundation_clusters_{timestamp}.csv")
+    with StreamingExporter(
+        engine, timestamp,
+        output=args.output,
+        person_leads=args.person_leads,
+        clusters=args.clusters
+    ) as exporter:
+        batch_result = await engine.enrich_batch(
+            schools=schools,
+            delay_between_schools=args.delay,
+            on_complete=exporter
+        )
+    batch_result.results_log = str(exporter.log_path)
     
     # Print summary
     engine.print_summary(batch_result)
@@ -893,5 +1423,9 @@ Examples:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        # uvloop.run, not set_event_loop_policy (deprecated from Python 3.14)
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
@@ -1,11 +1,52 @@
 """
 Pydantic models for structured data in Indonesia EdTech Lead Gen Engine
 """
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+from typing import Any, ClassVar, Dict, Optional, List
 from enum import Enum
 from datetime import datetime
+import operator
 import re
+import sys
+
+
+# Precompiled patterns used by the field validators
+_NON_DIGIT = re.compile(r'[^\d+]')          # Everything except digits and +
+_NON_DIGIT_STRICT = re.compile(r'\D')       # Everything except digits
+_WAME = re.compile(r'wa\.me/(\d+)')
+_PHONE_PARAM = re.compile(r'phone=(\d+)')
+_LINKEDIN_HOST = re.compile(r'(?:https?://)?([^/?#\s]+)', re.I)  # Scheme optional
+
+# Translation table deleting every Latin-1 char except digits and +
+_PHONE_TRANS = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(256) if chr(c) not in '0123456789+')
+)
+
+
+def _clean_phone(v: str) -> str:
+    """Strip everything but digits and + (str.translate fast path)"""
+    cleaned = v.translate(_PHONE_TRANS)
+    if not cleaned.isascii():
+        # Non-Latin-1 characters survive the table; let the regex handle them
+        return _NON_DIGIT.sub('', v)
+    return cleaned
+
+
+def _to_plus62(cleaned: str) -> Optional[str]:
+    """Convert a cleaned number to +62 format, None if it has no Indonesian prefix"""
+    prefix = cleaned[:2]
+    if prefix == '08':
+        return '+62' + cleaned[1:]
+    if prefix == '62':
+        return '+' + cleaned
+    if cleaned[:3] == '+62':
+        return cleaned
+    return None
+
+
+def intern_strings(values: List[str]) -> List[str]:
+    """Intern and de-duplicate strings that repeat across schools (URLs, LMS names)"""
+    return list(dict.fromkeys(sys.intern(s) for s in values))
 
 
 class SchoolType(str, Enum):
@@ -33,6 +74,13 @@ class RolePriority(str, Enum):
     LOWEST = "lowest"        # Other staff
 
 
+# Sort rank of each priority (0 = highest)
+ROLE_PRIORITY_ORDER = {priority: rank for rank, priority in enumerate(RolePriority)}
+
+# Sum of the base check weights in SchoolData.calculate_quality_score
+QUALITY_BASE_WEIGHT = 0.1 + 0.1 + 0.1 + 0.15 + 0.2 + 0.15 + 0.1 + 0.05 + 0.025 + 0.025
+
+
 # ===========================================
 # Input Models
 # ===========================================
@@ -44,15 +92,17 @@ class SchoolInput(BaseModel):
     location: str
     notes: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra='ignore',
+        json_schema_extra={
             "example": {
                 "name": "PPPK Petra",
                 "type": "Private Christian",
                 "location": "Surabaya",
                 "notes": "Elementary to High School, Education Board/Group"
             }
-        }
+        },
+    )
 
 
 # ===========================================
@@ -71,18 +121,8 @@ class PhoneNumber(BaseModel):
     @classmethod
     def normalize_phone(cls, v: str) -> str:
         """Normalize phone number to +62 format"""
-        # Remove all non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', v)
-        
-        # Convert to +62 format
-        if cleaned.startswith('08'):
-            return '+62' + cleaned[1:]
-        elif cleaned.startswith('62'):
-            return '+' + cleaned
-        elif cleaned.startswith('+62'):
-            return cleaned
-        
-        return cleaned
+        cleaned = _clean_phone(v)
+        return _to_plus62(cleaned) or cleaned
 
 
 class DecisionMaker(BaseModel):
@@ -117,35 +157,33 @@ class DecisionMaker(BaseModel):
             return None
         
         # Extract from wa.me links
-        wa_me_match = re.search(r'wa\.me/(\d+)', v)
-        if wa_me_match:
-            return '+' + wa_me_match.group(1)
+        if 'wa.me/' in v:
+            wa_me_match = _WAME.search(v)
+            if wa_me_match:
+                return '+' + wa_me_match.group(1)
         
         # Extract from api.whatsapp.com links
-        api_match = re.search(r'phone=(\d+)', v)
-        if api_match:
-            return '+' + api_match.group(1)
+        if 'phone=' in v:
+            api_match = _PHONE_PARAM.search(v)
+            if api_match:
+                return '+' + api_match.group(1)
         
         # Normalize direct number
-        cleaned = re.sub(r'[^\d+]', '', v)
-        if cleaned.startswith('08'):
-            return '+62' + cleaned[1:]
-        elif cleaned.startswith('62'):
-            return '+' + cleaned
-        elif cleaned.startswith('+62'):
-            return cleaned
-        
-        return v
+        return _to_plus62(_clean_phone(v)) or v
     
     @field_validator('linkedin_url')
     @classmethod
     def validate_linkedin(cls, v: Optional[str]) -> Optional[str]:
         """Validate LinkedIn URL"""
-        if not v:
+        if not v or not v.strip():
             return None
-        if 'linkedin.com' not in v.lower():
-            return None
-        return v
+        v = v.strip()
+        # Only the hostname (without any :port) is lowercased and checked
+        m = _LINKEDIN_HOST.match(v)
+        host = m.group(1).partition(':')[0].lower() if m else ""
+        if host == 'linkedin.com' or host.endswith('.linkedin.com'):
+            return v
+        return None
 
 
 # ===========================================
@@ -197,11 +235,23 @@ class SchoolData(BaseModel):
         """Validate NPSN is 8 digits"""
         if not v:
             return None
-        cleaned = re.sub(r'\D', '', v)
+        cleaned = _NON_DIGIT_STRICT.sub('', v)
         if len(cleaned) == 8:
             return cleaned
         return None
     
+    @field_validator('school_type')
+    @classmethod
+    def intern_school_type(cls, v: str) -> str:
+        """School types are a small enum-like set; share one string each"""
+        return sys.intern(v)
+    
+    @field_validator('source_urls', 'tech_stack')
+    @classmethod
+    def intern_lists(cls, v: List[str]) -> List[str]:
+        """Intern and de-duplicate URL/LMS strings"""
+        return intern_strings(v)
+    
     def get_primary_whatsapp(self) -> Optional[str]:
         """Get the best WhatsApp number available"""
         # First, check whatsapp_business
@@ -217,40 +267,50 @@ class SchoolData(BaseModel):
     
     def get_primary_contact(self) -> Optional[DecisionMaker]:
         """Get the highest priority decision maker with contact info"""
-        for dm in sorted(self.decision_makers, key=lambda x: list(RolePriority).index(x.priority)):
+        for dm in sorted(self.decision_makers, key=lambda x: ROLE_PRIORITY_ORDER[x.priority]):
             if dm.whatsapp or dm.email or dm.phone:
                 return dm
         return None
     
     def calculate_quality_score(self) -> float:
         """Calculate data quality score with verification bonus"""
-        score = 0.0
-        total_weight = 0.0
-        
-        # Base weights
-        checks = [
-            (bool(self.foundation_name), 0.1),
-            (bool(self.npsn), 0.1),
-            (bool(self.official_website), 0.1),
-            (bool(self.official_email), 0.15),
-            (bool(self.whatsapp_business), 0.2),        # High priority
-            (len(self.decision_makers) > 0, 0.15),
-            (any(dm.whatsapp for dm in self.decision_makers), 0.1),
-            (any(dm.linkedin_url for dm in self.decision_makers), 0.05),
-            (bool(self.instagram), 0.025),
-            (bool(self.facebook), 0.025),
-        ]
+        # One pass over decision makers for the per-person checks
+        dm_has_whatsapp = False
+        dm_has_linkedin = False
+        verified_contacts = 0
+        for dm in self.decision_makers:
+            if dm.whatsapp:
+                dm_has_whatsapp = True
+            if dm.linkedin_url:
+                dm_has_linkedin = True
+            if dm.whatsapp_verified and dm.email_verified:
+                verified_contacts += 1
         
-        for check, weight in checks:
-            total_weight += weight
-            if check:
-                score += weight
+        # Base weights (added in the same order as QUALITY_BASE_WEIGHT)
+        score = 0.0
+        if self.foundation_name:
+            score += 0.1
+        if self.npsn:
+            score += 0.1
+        if self.official_website:
+            score += 0.1
+        if self.official_email:
+            score += 0.15
+        if self.whatsapp_business:
+            score += 0.2        # High priority
+        if self.decision_makers:
+            score += 0.15
+        if dm_has_whatsapp:
+            score += 0.1
+        if dm_has_linkedin:
+            score += 0.05
+        if self.instagram:
+            score += 0.025
+        if self.facebook:
+            score += 0.025
+        total_weight = QUALITY_BASE_WEIGHT
         
         # NEW: Verification bonus (+30% if both WA and Email verified)
-        verified_contacts = sum(
-            1 for dm in self.decision_makers
-            if dm.whatsapp_verified and dm.email_verified
-        )
         if verified_contacts > 0:
             verification_bonus = min(0.3, verified_contacts * 0.1)
             score += verification_bonus
@@ -292,6 +352,34 @@ class ScrapedPage(BaseModel):
     error: Optional[str] = None
     scraped_at: str = Field(default_factory=lambda: datetime.now().isoformat())
     
+    # Lowercased content, computed on first use (None = not computed yet)
+    _html_lower: Optional[str] = PrivateAttr(default=None)
+    _text_lower: Optional[str] = PrivateAttr(default=None)
+    # href values of html_content, parsed once by the scraper (_page_hrefs)
+    _hrefs: Optional[tuple] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == 'html_content':
+            self._html_lower = None
+            self._hrefs = None
+        elif name == 'text_content':
+            self._text_lower = None
+    
+    @property
+    def html_lower(self) -> str:
+        """html_content lowercased once and shared by every consumer"""
+        if self._html_lower is None:
+            self._html_lower = self.html_content.lower()
+        return self._html_lower
+    
+    @property
+    def text_lower(self) -> str:
+        """text_content lowercased once and shared by every consumer"""
+        if self._text_lower is None:
+            self._text_lower = self.text_content.lower()
+        return self._text_lower
+    
     def is_priority_page(self, priority_keywords: List[str]) -> bool:
         """Check if this is a priority page based on URL"""
         url_lower = self.url.lower()
@@ -328,7 +416,8 @@ class BatchResult(BaseModel):
     total_schools: int
     successful: int
     failed: int
-    results: List[ProcessingResult]
+    results: List[ProcessingResult] = []
+    results_log: Optional[str] = None   # NDJSON log path when results were streamed
     started_at: str
     completed_at: Optional[str] = None
     total_time_seconds: float = 0.0
@@ -338,6 +427,44 @@ class BatchResult(BaseModel):
 # Person-Centric Lead Model (NEW)
 # ===========================================
 
+# Column order of PersonLead.to_dict() / to_row() (CSV/DataFrame export)
+PERSON_LEAD_COLUMNS = (
+    "School Name",
+    "Foundation",
+    "School Type",
+    "Location",
+    "Person Name",
+    "Role",
+    "Role (Indonesian)",
+    "Priority Tier",
+    "Direct WhatsApp",
+    "Direct Email",
+    "LinkedIn",
+    "Tech Stack",
+    "Source URL",
+    "Confidence",
+)
+
+# Attribute behind each export column, in the same order
+PERSON_LEAD_FIELDS = (
+    "school_name",
+    "foundation_name",
+    "school_type",
+    "location",
+    "person_name",
+    "role",
+    "role_indonesian",
+    "priority_tier",
+    "direct_whatsapp",
+    "direct_email",
+    "linkedin",
+    "tech_stack",
+    "source_url",
+    "confidence",
+)
+_person_lead_values = operator.attrgetter(*PERSON_LEAD_FIELDS)
+
+
 class PersonLead(BaseModel):
     """
     Person-centric lead for export
@@ -346,80 +473,74 @@ class PersonLead(BaseModel):
     This is the final output format optimized for B2B outreach
     """
     # School/Foundation context
+    # Missing values are "" rather than None, so exports can use them as-is
     school_name: str
-    foundation_name: Optional[str] = None
+    foundation_name: str = ""
     school_type: str = ""
     location: str = ""
     
     # Person information
     person_name: str
     role: str                               # English role
-    role_indonesian: Optional[str] = None   # Indonesian role (Bahasa)
+    role_indonesian: str = ""               # Indonesian role (Bahasa)
     priority_tier: int = 5                  # 1 = highest (Ketua Yayasan), 5 = lowest
     
     # Direct contacts (specific to this person)
-    direct_whatsapp: Optional[str] = None
-    direct_email: Optional[str] = None
-    linkedin: Optional[str] = None
+    direct_whatsapp: str = ""
+    direct_email: str = ""
+    linkedin: str = ""
     
     # Tech context (for EdTech sales)
     tech_stack: str = ""                    # Comma-separated LMS list
     
     # Source tracking
-    source_url: Optional[str] = None
+    source_url: str = ""
     confidence: float = Field(default=0.0, ge=0.0, le=1.0)
     
+    # Priority tier for each role priority
+    _TIER_MAP: ClassVar[Dict[RolePriority, int]] = {
+        RolePriority.HIGHEST: 1,
+        RolePriority.HIGH: 2,
+        RolePriority.MEDIUM: 3,
+        RolePriority.LOW: 4,
+        RolePriority.LOWEST: 5,
+    }
+    
     @classmethod
     def from_decision_maker(
         cls,
         dm: DecisionMaker,
         school_data: 'SchoolData'
     ) -> 'PersonLead':
-        """Create PersonLead from DecisionMaker and SchoolData"""
-        # Determine priority tier from role priority
-        tier_map = {
-            RolePriority.HIGHEST: 1,
-            RolePriority.HIGH: 2,
-            RolePriority.MEDIUM: 3,
-            RolePriority.LOW: 4,
-            RolePriority.LOWEST: 5,
-        }
+        """
+        Create PersonLead from DecisionMaker and SchoolData
         
-        return cls(
+        Both inputs are already validated models, so validation is skipped
+        """
+        return cls.model_construct(
             school_name=school_data.school_name,
-            foundation_name=school_data.foundation_name,
+            foundation_name=school_data.foundation_name or "",
             school_type=school_data.school_type,
             location=school_data.location,
             person_name=dm.name or "Unknown",
             role=dm.role or "",
-            role_indonesian=dm.role_indonesian,
-            priority_tier=tier_map.get(dm.priority, 5),
-            direct_whatsapp=dm.whatsapp,
-            direct_email=dm.email,
-            linkedin=dm.linkedin_url,
-            tech_stack=", ".join(school_data.tech_stack) if school_data.tech_stack else "",
-            source_url=dm.source_url,
+            role_indonesian=dm.role_indonesian or "",
+            priority_tier=cls._TIER_MAP.get(dm.priority, 5),
+            direct_whatsapp=dm.whatsapp or "",
+            direct_email=dm.email or "",
+            linkedin=dm.linkedin_url or "",
+            tech_stack=sys.intern(", ".join(school_data.tech_stack)) if school_data.tech_stack else "",
+            source_url=dm.source_url or "",
             confidence=dm.confidence,
         )
     
+    def to_row(self) -> tuple:
+        """Export values in PERSON_LEAD_COLUMNS order (no per-row dict)"""
+        return _person_lead_values(self)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for CSV/DataFrame export"""
-        return {
-            "School Name": self.school_name,
-            "Foundation": self.foundation_name or "",
-            "School Type": self.school_type,
-            "Location": self.location,
-            "Person Name": self.person_name,
-            "Role": self.role,
-            "Role (Indonesian)": self.role_indonesian or "",
-            "Priority Tier": self.priority_tier,
-            "Direct WhatsApp": self.direct_whatsapp or "",
-            "Direct Email": self.direct_email or "",
-            "LinkedIn": self.linkedin or "",
-            "Tech Stack": self.tech_stack,
-            "Source URL": self.source_url or "",
-            "Confidence": self.confidence,
-        }
+        return dict(zip(PERSON_LEAD_COLUMNS, self.to_row()))
 
 
 # ===========================================
@@ -2,446 +2,281 @@
 School data definitions for Indonesia EdTech Lead Gen Engine
 Contains all target schools organized by priority and location
 """
+import re
+from functools import lru_cache
 from models import SchoolInput
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+# Raw (name, type, location, notes) rows; SchoolInput objects are only
+# built by the getters below, for the schools a caller actually asks for
+RawSchool = Tuple[str, str, str, str]
+
+# Any religious school type (matched against the lowercased type)
+_RELIGIOUS_RE = re.compile(r'christian|catholic|islamic|buddhist|muslim')
 
 
 # ===========================================
 # PRIORITY SCHOOLS - Surabaya (Week 1)
 # ===========================================
-PRIORITY_SCHOOLS: List[SchoolInput] = [
-    SchoolInput(
-        name="PPPK Petra",
-        type="Private Christian",
-        location="Surabaya",
-        notes="Elementary to High School, Education Board/Group - Major Christian school network"
-    ),
-    SchoolInput(
-        name="Yohanes Gabriel Foundation",
-        type="Private Catholic",
-        location="Surabaya",
-        notes="Elementary to High School, Religious Foundation - Well-established Catholic school"
-    ),
-    SchoolInput(
-        name="Santa Clara Catholic School",
-        type="Private Catholic",
-        location="Surabaya",
-        notes="Elementary to Junior High, Religious Foundation"
-    ),
-    SchoolInput(
-        name="Gloria Christian School",
-        type="Private Christian",
-        location="Surabaya",
-        notes="Elementary to High School, Foundation"
-    ),
-    SchoolInput(
-        name="Stella Maris School",
-        type="Private Catholic",
-        location="Surabaya",
-        notes="Elementary to Junior High, Foundation - Part of larger Stella Maris network"
-    ),
-]
+_RAW_PRIORITY: Tuple[RawSchool, ...] = (
+    ("PPPK Petra", "Private Christian", "Surabaya",
+     "Elementary to High School, Education Board/Group - Major Christian school network"),
+    ("Yohanes Gabriel Foundation", "Private Catholic", "Surabaya",
+     "Elementary to High School, Religious Foundation - Well-established Catholic school"),
+    ("Santa Clara Catholic School", "Private Catholic", "Surabaya",
+     "Elementary to Junior High, Religious Foundation"),
+    ("Gloria Christian School", "Private Christian", "Surabaya",
+     "Elementary to High School, Foundation"),
+    ("Stella Maris School", "Private Catholic", "Surabaya",
+     "Elementary to Junior High, Foundation - Part of larger Stella Maris network"),
+)
 
 
 # ===========================================
 # NATIONAL/GROUP SCHOOLS
 # ===========================================
-NATIONAL_GROUP_SCHOOLS: List[SchoolInput] = [
+_RAW_NATIONAL: Tuple[RawSchool, ...] = (
     # Lippo Group Schools
-    SchoolInput(
-        name="Sekolah Dian Harapan",
-        type="Private Christian",
-        location="Multiple cities",
-        notes="Kindergarten to High School, Lippo/YPPH Group - Major education group"
-    ),
-    SchoolInput(
-        name="Sekolah Pelita Harapan",
-        type="Private International",
-        location="Multiple cities",
-        notes="Preschool to High School, Lippo/YPPH Group - Premium international school"
-    ),
+    ("Sekolah Dian Harapan", "Private Christian", "Multiple cities",
+     "Kindergarten to High School, Lippo/YPPH Group - Major education group"),
+    ("Sekolah Pelita Harapan", "Private International", "Multiple cities",
+     "Preschool to High School, Lippo/YPPH Group - Premium international school"),
     
     # Major National Groups
-    SchoolInput(
-        name="BINUS School",
-        type="Private International",
-        location="Multiple cities",
-        notes="Preschool to High School, BINUS Education Group"
-    ),
-    SchoolInput(
-        name="BPK Penabur",
-        type="Private Christian",
-        location="Multiple cities",
-        notes="Preschool to High School, National Christian Education Group"
-    ),
-    SchoolInput(
-        name="Tarakanita",
-        type="Private Catholic",
-        location="Multiple cities",
-        notes="Preschool to High School, National Catholic Education Group"
-    ),
-    SchoolInput(
-        name="Al Azhar Islamic School",
-        type="Private Islamic",
-        location="Multiple cities",
-        notes="Preschool to High School, National Islamic Education Group"
-    ),
-    SchoolInput(
-        name="Singapore Intercultural School",
-        type="International",
-        location="Multiple cities",
-        notes="Preschool to High School, SIS Global Group"
-    ),
-]
+    ("BINUS School", "Private International", "Multiple cities",
+     "Preschool to High School, BINUS Education Group"),
+    ("BPK Penabur", "Private Christian", "Multiple cities",
+     "Preschool to High School, National Christian Education Group"),
+    ("Tarakanita", "Private Catholic", "Multiple cities",
+     "Preschool to High School, National Catholic Education Group"),
+    ("Al Azhar Islamic School", "Private Islamic", "Multiple cities",
+     "Preschool to High School, National Islamic Education Group"),
+    ("Singapore Intercultural School", "International", "Multiple cities",
+     "Preschool to High School, SIS Global Group"),
+)
 
 
 # ===========================================
 # REGIONAL SCHOOLS
 # ===========================================
-REGIONAL_SCHOOLS: List[SchoolInput] = [
+_RAW_REGIONAL: Tuple[RawSchool, ...] = (
     # Surabaya/East Java
-    SchoolInput(
-        name="Sekolah Taman Mahatma Gandhi",
-        type="Private National Plus",
-        location="Surabaya",
-        notes="Kindergarten to High School"
-    ),
-    SchoolInput(
-        name="San Jose School",
-        type="Private Catholic",
-        location="Surabaya",
-        notes="Kindergarten to High School"
-    ),
-    SchoolInput(
-        name="Jembatan Bangsa School",
-        type="Private National Plus",
-        location="Surabaya",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Universal School",
-        type="Private National Plus",
-        location="Surabaya",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Albana Islamic School",
-        type="Private Islamic",
-        location="Surabaya",
-        notes="Elementary to Junior High"
-    ),
-    SchoolInput(
-        name="Anak Emas School",
-        type="Private National Plus",
-        location="Surabaya",
-        notes="Preschool to Elementary"
-    ),
+    ("Sekolah Taman Mahatma Gandhi", "Private National Plus", "Surabaya",
+     "Kindergarten to High School"),
+    ("San Jose School", "Private Catholic", "Surabaya",
+     "Kindergarten to High School"),
+    ("Jembatan Bangsa School", "Private National Plus", "Surabaya",
+     "Preschool to High School"),
+    ("Universal School", "Private National Plus", "Surabaya",
+     "Preschool to High School"),
+    ("Albana Islamic School", "Private Islamic", "Surabaya",
+     "Elementary to Junior High"),
+    ("Anak Emas School", "Private National Plus", "Surabaya",
+     "Preschool to Elementary"),
     
     # Semarang/Central Java
-    SchoolInput(
-        name="Sekolah Nasima",
-        type="Private Islamic",
-        location="Semarang",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Semarang Multinational School",
-        type="International",
-        location="Semarang",
-        notes="Preschool to High School, Independent Foundation"
-    ),
-    SchoolInput(
-        name="Sekolah Nusaputera",
-        type="Private National",
-        location="Semarang",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Sekolah Islam Bina Amal",
-        type="Private Islamic",
-        location="Semarang",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Pangudi Luhur Bernadus",
-        type="Private Catholic",
-        location="Semarang",
-        notes="Elementary to Junior High"
-    ),
-    SchoolInput(
-        name="Sekolah Tunas Bangsa",
-        type="Private Christian",
-        location="Semarang",
-        notes="Preschool to High School"
-    ),
-]
+    ("Sekolah Nasima", "Private Islamic", "Semarang",
+     "Preschool to High School"),
+    ("Semarang Multinational School", "International", "Semarang",
+     "Preschool to High School, Independent Foundation"),
+    ("Sekolah Nusaputera", "Private National", "Semarang",
+     "Preschool to High School"),
+    ("Sekolah Islam Bina Amal", "Private Islamic", "Semarang",
+     "Preschool to High School"),
+    ("Pangudi Luhur Bernadus", "Private Catholic", "Semarang",
+     "Elementary to Junior High"),
+    ("Sekolah Tunas Bangsa", "Private Christian", "Semarang",
+     "Preschool to High School"),
+)
 
 
 # ===========================================
 # JAKARTA B2B TARGETS (Koding Next Poach)
 # ===========================================
-JAKARTA_B2B_TARGETS: List[SchoolInput] = [
+_RAW_JAKARTA_B2B: Tuple[RawSchool, ...] = (
     # International Schools
-    SchoolInput(
-        name="ACG School Jakarta",
-        type="International",
-        location="Jakarta",
-        notes="Kindergarten to High School, Inspired Education Global Group"
-    ),
-    SchoolInput(
-        name="Australian Independent School",
-        type="International",
-        location="Jakarta",
-        notes="Preschool to High School, Independent Foundation"
-    ),
-    SchoolInput(
-        name="Jakarta Intercultural School",
-        type="International",
-        location="Jakarta",
-        notes="Preschool to High School, Premium International School - JIS"
-    ),
-    SchoolInput(
-        name="Jakarta Multicultural School",
-        type="International",
-        location="Jakarta",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Independent School Jakarta",
-        type="International",
-        location="Jakarta",
-        notes="Preschool to Junior High"
-    ),
-    SchoolInput(
-        name="BTB School",
-        type="International",
-        location="Jakarta",
-        notes="Preschool to High School, Bina Tunas Bangsa"
-    ),
-    SchoolInput(
-        name="Bina Bangsa School",
-        type="Private International",
-        location="Jakarta",
-        notes="Preschool to High School, BBS Group"
-    ),
+    ("ACG School Jakarta", "International", "Jakarta",
+     "Kindergarten to High School, Inspired Education Global Group"),
+    ("Australian Independent School", "International", "Jakarta",
+     "Preschool to High School, Independent Foundation"),
+    ("Jakarta Intercultural School", "International", "Jakarta",
+     "Preschool to High School, Premium International School - JIS"),
+    ("Jakarta Multicultural School", "International", "Jakarta",
+     "Preschool to High School"),
+    ("Independent School Jakarta", "International", "Jakarta",
+     "Preschool to Junior High"),
+    ("BTB School", "International", "Jakarta",
+     "Preschool to High School, Bina Tunas Bangsa"),
+    ("Bina Bangsa School", "Private International", "Jakarta",
+     "Preschool to High School, BBS Group"),
     
     # National Plus Schools
-    SchoolInput(
-        name="Sekolah Cikal",
-        type="Private National Plus",
-        location="Jakarta",
-        notes="Preschool to High School, Education Group"
-    ),
-    SchoolInput(
-        name="Sekolah Cita Buana",
-        type="Private National Plus",
-        location="Jakarta",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Global Prestasi School",
-        type="Private",
-        location="Jakarta",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Jakarta Bilingual Montessori School",
-        type="Private",
-        location="Jakarta",
-        notes="Preschool to Junior High, JBMS"
-    ),
-    SchoolInput(
-        name="Jakarta Nanyang School",
-        type="Private Trilingual",
-        location="Jakarta",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Sekolah Karakter",
-        type="Private",
-        location="Jakarta",
-        notes="Preschool to High School, Character Education Focus"
-    ),
+    ("Sekolah Cikal", "Private National Plus", "Jakarta",
+     "Preschool to High School, Education Group"),
+    ("Sekolah Cita Buana", "Private National Plus", "Jakarta",
+     "Preschool to High School"),
+    ("Global Prestasi School", "Private", "Jakarta",
+     "Preschool to High School"),
+    ("Jakarta Bilingual Montessori School", "Private", "Jakarta",
+     "Preschool to Junior High, JBMS"),
+    ("Jakarta Nanyang School", "Private Trilingual", "Jakarta",
+     "Preschool to High School"),
+    ("Sekolah Karakter", "Private", "Jakarta",
+     "Preschool to High School, Character Education Focus"),
     
     # Religious Schools
-    SchoolInput(
-        name="Al-Wildan Islamic School",
-        type="Private Islamic",
-        location="Jakarta",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Nizhamia Andalusia",
-        type="Private Islamic",
-        location="Jakarta",
-        notes="Preschool & Elementary"
-    ),
-    SchoolInput(
-        name="Marie Joseph School",
-        type="Private Catholic",
-        location="Jakarta",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Mawar Sharon Christian School",
-        type="Private Christian",
-        location="Jakarta",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Saint John's School",
-        type="Private Catholic",
-        location="Jakarta",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Sekolah Lentera Kasih",
-        type="Private Christian",
-        location="Jakarta",
-        notes="Preschool to High School, SLK"
-    ),
-    SchoolInput(
-        name="Tzu Chi School",
-        type="Private Buddhist",
-        location="Jakarta",
-        notes="Preschool to High School, Buddhist Foundation"
-    ),
+    ("Al-Wildan Islamic School", "Private Islamic", "Jakarta",
+     "Preschool to High School"),
+    ("Nizhamia Andalusia", "Private Islamic", "Jakarta",
+     "Preschool & Elementary"),
+    ("Marie Joseph School", "Private Catholic", "Jakarta",
+     "Preschool to High School"),
+    ("Mawar Sharon Christian School", "Private Christian", "Jakarta",
+     "Preschool to High School"),
+    ("Saint John's School", "Private Catholic", "Jakarta",
+     "Preschool to High School"),
+    ("Sekolah Lentera Kasih", "Private Christian", "Jakarta",
+     "Preschool to High School, SLK"),
+    ("Tzu Chi School", "Private Buddhist", "Jakarta",
+     "Preschool to High School, Buddhist Foundation"),
     
     # Specialized/Other
-    SchoolInput(
-        name="All-Star Academy",
-        type="Private/Hybrid",
-        location="Jakarta",
-        notes="Preschool to High School"
-    ),
-    SchoolInput(
-        name="Julia Gabriel Centre",
-        type="Enrichment/Preschool",
-        location="Jakarta",
-        notes="Early Learning, Franchise Group"
-    ),
-    SchoolInput(
-        name="Playhouse Academy",
-        type="Preschool",
-        location="Jakarta",
-        notes="Early Years"
-    ),
+    ("All-Star Academy", "Private/Hybrid", "Jakarta",
+     "Preschool to High School"),
+    ("Julia Gabriel Centre", "Enrichment/Preschool", "Jakarta",
+     "Early Learning, Franchise Group"),
+    ("Playhouse Academy", "Preschool", "Jakarta",
+     "Early Years"),
     
     # Public Schools (for reference)
-    SchoolInput(
-        name="SMA Negeri 6 Jakarta",
-        type="Public",
-        location="Jakarta",
-        notes="Senior High School, Government - Top public school"
-    ),
-    SchoolInput(
-        name="SMA Negeri 70 Jakarta",
-        type="Public",
-        location="Jakarta",
-        notes="Senior High School, Government - Top public school"
-    ),
-]
+    ("SMA Negeri 6 Jakarta", "Public", "Jakarta",
+     "Senior High School, Government - Top public school"),
+    ("SMA Negeri 70 Jakarta", "Public", "Jakarta",
+     "Senior High School, Government - Top public school"),
+)
 
 
 # ===========================================
 # BALI SCHOOLS
 # ===========================================
-BALI_SCHOOLS: List[SchoolInput] = [
-    SchoolInput(
-        name="Pelangi School",
-        type="Private",
-        location="Bali",
-        notes="Preschool to Junior High"
-    ),
-    SchoolInput(
-        name="Taman Rama Intercultural School",
-        type="Private",
-        location="Bali",
-        notes="Preschool to High School"
-    ),
-]
+_RAW_BALI: Tuple[RawSchool, ...] = (
+    ("Pelangi School", "Private", "Bali",
+     "Preschool to Junior High"),
+    ("Taman Rama Intercultural School", "Private", "Bali",
+     "Preschool to High School"),
+)
 
 
 # ===========================================
 # UTILITY FUNCTIONS
 # ===========================================
 
+def _build(rows) -> List[SchoolInput]:
+    """Instantiate SchoolInput for raw (name, type, location, notes) rows"""
+    return [
+        SchoolInput(name=name, type=type_, location=location, notes=notes)
+        for name, type_, location, notes in rows
+    ]
+
+
+@lru_cache(maxsize=1)
+def _all_raw() -> Tuple[RawSchool, ...]:
+    """All raw rows, in database order (concatenated once)"""
+    return _RAW_PRIORITY + _RAW_NATIONAL + _RAW_REGIONAL + _RAW_JAKARTA_B2B + _RAW_BALI
+
+
+@lru_cache(maxsize=1)
+def _lower_columns() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Lowercased (types, locations), aligned with _all_raw(), for the filters"""
+    rows = _all_raw()
+    return (
+        tuple(row[1].lower() for row in rows),
+        tuple(row[2].lower() for row in rows),
+    )
+
+
+def _filter_types(predicate) -> List[SchoolInput]:
+    """Build the schools whose lowercased type satisfies `predicate`"""
+    types_lower, _ = _lower_columns()
+    return _build(row for row, t in zip(_all_raw(), types_lower) if predicate(t))
+
+
 def get_priority_schools() -> List[SchoolInput]:
     """Get the 5 priority schools in Surabaya for Week 1"""
-    return PRIORITY_SCHOOLS
+    return _build(_RAW_PRIORITY)
 
 
-def get_all_schools() -> List[SchoolInput]:
-    """Get all schools in the database"""
-    all_schools = []
-    all_schools.extend(PRIORITY_SCHOOLS)
-    all_schools.extend(NATIONAL_GROUP_SCHOOLS)
-    all_schools.extend(REGIONAL_SCHOOLS)
-    all_schools.extend(JAKARTA_B2B_TARGETS)
-    all_schools.extend(BALI_SCHOOLS)
-    return all_schools
+@lru_cache(maxsize=1)
+def get_all_schools() -> Tuple[SchoolInput, ...]:
+    """Get all schools in the database (built once, shared immutable tuple)"""
+    return tuple(_build(_all_raw()))
 
 
 def get_schools_by_location(location: str) -> List[SchoolInput]:
     """Filter schools by location (case-insensitive partial match)"""
     location_lower = location.lower()
-    return [
-        school for school in get_all_schools()
-        if location_lower in school.location.lower()
-    ]
+    _, locations_lower = _lower_columns()
+    return _build(
+        row for row, loc in zip(_all_raw(), locations_lower) if location_lower in loc
+    )
+
+
+# Lowercased name -> raw row, built on first name lookup
+_name_index_cache: Optional[Dict[str, RawSchool]] = None
+
+
+def _get_name_index() -> Dict[str, RawSchool]:
+    """Lazily build the lowercase name index (first row wins on duplicates)"""
+    global _name_index_cache
+    if _name_index_cache is None:
+        index: Dict[str, RawSchool] = {}
+        for row in _all_raw():
+            index.setdefault(row[0].lower(), row)
+        _name_index_cache = index
+    return _name_index_cache
+
+
+def find_schools_by_name(name: str) -> List[SchoolInput]:
+    """Find schools whose name contains `name` (case-insensitive)"""
+    name_lower = name.lower()
+    return _build(row for key, row in _get_name_index().items() if name_lower in key)
 
 
 def get_schools_by_type(school_type: str) -> List[SchoolInput]:
     """Filter schools by type (case-insensitive partial match)"""
     type_lower = school_type.lower()
-    return [
-        school for school in get_all_schools()
-        if type_lower in school.type.lower()
-    ]
+    return _filter_types(lambda t: type_lower in t)
 
 
 def get_international_schools() -> List[SchoolInput]:
     """Get all international schools"""
-    return [
-        school for school in get_all_schools()
-        if 'international' in school.type.lower()
-    ]
+    return _filter_types(lambda t: 'international' in t)
 
 
 def get_religious_schools(religion: str = None) -> List[SchoolInput]:
     """Get religious schools, optionally filtered by religion"""
-    all_schools = get_all_schools()
-    
     if religion:
         religion_lower = religion.lower()
-        return [
-            school for school in all_schools
-            if religion_lower in school.type.lower()
-        ]
+        return _filter_types(lambda t: religion_lower in t)
     
     # All religious schools
-    religious_keywords = ['christian', 'catholic', 'islamic', 'buddhist', 'muslim']
-    return [
-        school for school in all_schools
-        if any(kw in school.type.lower() for kw in religious_keywords)
-    ]
+    return _filter_types(_RELIGIOUS_RE.search)
 
 
 def get_schools_batch(batch_size: int = 5, offset: int = 0) -> List[SchoolInput]:
     """Get a batch of schools for processing (useful for rate limiting)"""
-    all_schools = get_all_schools()
-    return all_schools[offset:offset + batch_size]
+    return _build(_all_raw()[offset:offset + batch_size])
 
 
 def get_school_count() -> dict:
     """Get count of schools by category"""
     return {
-        "priority_surabaya": len(PRIORITY_SCHOOLS),
-        "national_groups": len(NATIONAL_GROUP_SCHOOLS),
-        "regional": len(REGIONAL_SCHOOLS),
-        "jakarta_b2b": len(JAKARTA_B2B_TARGETS),
-        "bali": len(BALI_SCHOOLS),
-        "total": len(get_all_schools())
+        "priority_surabaya": len(_RAW_PRIORITY),
+        "national_groups": len(_RAW_NATIONAL),
+        "regional": len(_RAW_REGIONAL),
+        "jakarta_b2b": len(_RAW_JAKARTA_B2B),
+        "bali": len(_RAW_BALI),
+        "total": len(_all_raw())
     }
 
 
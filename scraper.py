@@ -3,17 +3,167 @@ Web scraper for Indonesia EdTech Lead Gen Engine
 Uses Crawl4AI (optimized for LLM) with Playwright fallback
 """
 import asyncio
+import contextlib
+import functools
+import io
 import re
-from typing import List, Optional, Set
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urljoin, urlparse
 from config import config
-from models import ScrapedPage
+from models import ScrapedPage, _clean_phone
 import logging
 
+try:
+    import ahocorasick  # pyahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _build_lms_automaton():
+    """One Aho-Corasick automaton over every LMS indicator (lowercased)"""
+    owners: Dict[str, Tuple[str, ...]] = {}
+    for lms_name, indicators in config.LMS_INDICATORS.items():
+        for indicator in indicators:
+            key = indicator.lower()
+            owners[key] = owners.get(key, ()) + (lms_name,)
+    
+    automaton = ahocorasick.Automaton()
+    for key, lms_names in owners.items():
+        automaton.add_word(key, lms_names)
+    automaton.make_automaton()
+    return automaton
+
+
+# Finds all LMS indicators in a single pass per page (None: use substring scan)
+_LMS_AUTOMATON = _build_lms_automaton() if AHOCORASICK_AVAILABLE else None
+
+# URL suffixes that are never HTML pages (checked in one str.endswith call)
+_SKIP_EXTS = ('.css', '.js', '.jpg', '.jpeg', '.png', '.gif', '.svg',
+              '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.zip', '.mp3', '.mp4')
+
+# Longest text the contact extractors scan; longer input keeps its head and tail
+_MAX_SCAN = 200_000
+
+# Patterns compiled once at import
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+# wa.me links, api.whatsapp.com links and "WA: 08xx" labels in one scan
+_WHATSAPP_RE = re.compile(
+    r'wa\.me/(?P<wame>\d+)'
+    r'|api\.whatsapp\.com/send\?phone=(?P<api>\d+)'
+    r'|(?:WA|WhatsApp|Whatsapp)[:\s]*(?P<label>[+]?[\d\s\-()]+)',
+    re.IGNORECASE
+)
+# Indonesian phone formats, scanned one at a time (their matches may overlap)
+_PHONE_PATTERNS = (
+    re.compile(r'\+62[\d\s\-]{8,15}'),      # +62 format
+    re.compile(r'62[\d\s\-]{8,15}'),        # 62 format
+    re.compile(r'08[\d\s\-]{8,13}'),        # 08xx format
+    re.compile(r'0\d{2,3}[\s\-]?\d{6,8}'),  # Landline: 021-1234567
+)
+# Character classes already cover both cases, so no IGNORECASE case-folding
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_IG_RE = re.compile(r'instagram\.com/([a-zA-Z0-9_.]+)', re.IGNORECASE)
+_FB_RE = re.compile(r'facebook\.com/([a-zA-Z0-9.]+)', re.IGNORECASE)
+_YT_RE = re.compile(r'youtube\.com/(?:c/|channel/|@)([a-zA-Z0-9_-]+)', re.IGNORECASE)
+_LI_RE = re.compile(r'linkedin\.com/(?:company|school)/([a-zA-Z0-9-]+)', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+# Placeholder addresses (example.com & co.), matched on the domain only
+_SKIP_EMAIL_RE = re.compile(r'[@.](?:example|domain|email|test)\.com$', re.IGNORECASE)
+# PDF URLs that look like organization-structure documents
+_STRUCTURE_RE = re.compile(
+    r'struktur|organisasi|organization|structure|pengurus|board|yayasan|foundation'
+    r'|about|tentang|profil|profile',
+    re.IGNORECASE
+)
+# Linktree labels worth keeping as contact links
+_ROLE_RE = re.compile(
+    r'principal|kepala|director|direktur|admissions?|pendaftaran|contact|kontak|hubungi',
+    re.IGNORECASE
+)
+# Label text before / after a wa.me link (Linktree-style pages)
+_WA_LABEL_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r'(?:<[^>]*>)*\s*([^<>]{1,50})\s*(?:</[^>]*>)*\s*(?:<a[^>]*href=["\']([^"\']*wa\.me[^"\']*)["\'][^>]*>)',
+    r'(?:<a[^>]*href=["\']([^"\']*wa\.me[^"\']*)["\'][^>]*>)\s*(?:<[^>]*>)*\s*([^<>]{1,50})',
+))
+
+
+def _page_hrefs(page: ScrapedPage) -> Tuple[str, ...]:
+    """
+    All href values in a page, parsed once and kept on the page
+    
+    Link, social and PDF extraction all read the same page, so they share
+    one parse; it lives (and is freed) with the ScrapedPage.
+    """
+    if page._hrefs is None:
+        page._hrefs = _parse_hrefs(page.html_content)
+    return page._hrefs
+
+
+def _parse_hrefs(html: str) -> Tuple[str, ...]:
+    """All href values in html; selectolax when installed, else a regex"""
+    if SELECTOLAX_AVAILABLE:
+        return tuple(
+            href for node in HTMLParser(html).css("[href]")
+            if (href := node.attributes.get("href"))
+        )
+    return tuple(_HREF_RE.findall(html))
+
+
+def _scan_window(text: str) -> str:
+    """Cap text at _MAX_SCAN chars, keeping the header and footer where contacts live"""
+    if len(text) <= _MAX_SCAN:
+        return text
+    half = _MAX_SCAN // 2
+    return text[:half] + "\n" + text[-half:]
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_indonesian_phone(phone: str) -> Optional[str]:
+    """Normalize phone number to +62 format (memoized: pages repeat numbers)"""
+    if not phone:
+        return None
+    
+    # Remove all non-digit characters except +
+    cleaned = _clean_phone(phone)
+    
+    if len(cleaned) < 10:
+        return None
+    
+    # Convert to +62 format
+    if cleaned.startswith('08'):
+        return '+62' + cleaned[1:]
+    elif cleaned.startswith('62') and not cleaned.startswith('+'):
+        return '+' + cleaned
+    elif cleaned.startswith('+62'):
+        return cleaned
+    elif cleaned.startswith('0'):
+        # Landline
+        return '+62' + cleaned[1:]
+    
+    return None
+
+
 class WebScraper:
     """
     Web scraper optimized for extracting school/foundation information
@@ -26,6 +176,78 @@ class WebScraper:
         self.visited_urls: Set[str] = set()
         self.delay = config.SCRAPE_DELAY_SECONDS
         self._crawl4ai_available = self._check_crawl4ai()
+        # Shared httpx.AsyncClient, set by the engine for the duration of a batch
+        self.client = None
+        # One C-level search per link instead of a keyword loop
+        self._priority_re = re.compile(
+            '|'.join(re.escape(kw) for kw in config.PRIORITY_PAGES), re.IGNORECASE
+        )
+        # Caps in-flight page fetches across every crawl using this scraper
+        self._page_concurrency = max(1, config.MAX_CONCURRENT_PAGES)
+        self._sem = asyncio.Semaphore(self._page_concurrency)
+        # Browser session reused across pages while inside "async with scraper"
+        self._session: Optional[contextlib.AsyncExitStack] = None
+        self._session_lock: Optional[asyncio.Lock] = None
+        self._crawler = None
+        self._context = None
+        self._owns_client = False
+    
+    async def __aenter__(self) -> "WebScraper":
+        self._session = contextlib.AsyncExitStack()
+        self._session_lock = asyncio.Lock()
+        if self.client is None:
+            # No engine-provided client: pool PDF / Maps requests for the session
+            import httpx
+            self.client = await self._session.enter_async_context(httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(30.0)
+            ))
+            self._owns_client = True
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        session, self._session = self._session, None
+        self._crawler = self._context = None
+        if self._owns_client:
+            self.client = None
+            self._owns_client = False
+        if session is not None:
+            await session.aclose()
+    
+    async def _get_crawler(self):
+        """Session Crawl4AI crawler, started on first use (None outside a session)"""
+        if self._session is None:
+            return None
+        async with self._session_lock:
+            if self._crawler is None:
+                from crawl4ai import AsyncWebCrawler
+                self._crawler = await self._session.enter_async_context(
+                    AsyncWebCrawler(headless=config.HEADLESS_BROWSER, verbose=False)
+                )
+        return self._crawler
+    
+    async def _get_browser_context(self):
+        """Session Playwright context, launched on first use (None outside a session)"""
+        if self._session is None:
+            return None
+        async with self._session_lock:
+            if self._context is None:
+                from playwright.async_api import async_playwright
+                p = await self._session.enter_async_context(async_playwright())
+                browser = await p.chromium.launch(headless=config.HEADLESS_BROWSER)
+                self._session.push_async_callback(browser.close)
+                self._context = await browser.new_context(
+                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                )
+        return self._context
+    
+    def _http(self):
+        """Shared client when the engine provides one, else a one-off client"""
+        if self.client is not None:
+            return contextlib.nullcontext(self.client)
+        import httpx
+        return httpx.AsyncClient()
     
     def _check_crawl4ai(self) -> bool:
         """Check if Crawl4AI is available"""
@@ -36,16 +258,22 @@ class WebScraper:
             logger.warning("Crawl4AI not installed. Using Playwright fallback.")
             return False
     
+    async def _bounded_scrape(self, url: str) -> ScrapedPage:
+        """scrape_page under the concurrency cap, keeping the per-page delay"""
+        async with self._sem:
+            logger.info("  📄 Scraping: %s", url)
+            page = await self.scrape_page(url)
+            # Rate limiting
+            await asyncio.sleep(self.delay)
+            return page
+    
     async def scrape_page(self, url: str) -> ScrapedPage:
         """
         Scrape a single page, automatically choosing the best method
         """
         # Skip non-HTML files
-        skip_extensions = ['.css', '.js', '.jpg', '.jpeg', '.png', '.gif', '.svg', 
-                          '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.zip', '.mp3', '.mp4']
-        url_lower = url.lower()
-        if any(url_lower.endswith(ext) for ext in skip_extensions):
-            logger.debug(f"Skipping non-HTML file: {url}")
+        if url.lower().endswith(_SKIP_EXTS):
+            logger.debug("Skipping non-HTML file: %s", url)
             return ScrapedPage(url=url, title="", html_content="", text_content="", success=False, error="Skipped non-HTML")
         
         if self._crawl4ai_available:
@@ -58,10 +286,16 @@ class WebScraper:
         try:
             from crawl4ai import AsyncWebCrawler
             
-            async with AsyncWebCrawler(
-                headless=config.HEADLESS_BROWSER,
-                verbose=False
-            ) as crawler:
+            session_crawler = await self._get_crawler()
+            if session_crawler is not None:
+                crawler_cm = contextlib.nullcontext(session_crawler)
+            else:
+                crawler_cm = AsyncWebCrawler(
+                    headless=config.HEADLESS_BROWSER,
+                    verbose=False
+                )
+            
+            async with crawler_cm as crawler:
                 result = await crawler.arun(
                     url=url,
                     bypass_cache=True,
@@ -69,17 +303,18 @@ class WebScraper:
                 )
                 
                 # Crawl4AI provides clean markdown output
-                return ScrapedPage(
+                scraped = ScrapedPage(
                     url=url,
                     title=result.metadata.get("title", "") if result.metadata else "",
                     html_content=result.html or "",
                     text_content=result.markdown or result.cleaned_html or "",
-                    links=self._extract_links(result.html or "", url),
                     success=True
                 )
+                scraped.links = self._extract_links(scraped)
+                return scraped
                 
         except Exception as e:
-            logger.error(f"Crawl4AI error for {url}: {e}")
+            logger.error("Crawl4AI error for %s: %s", url, e)
             # Try Playwright as fallback
             return await self._scrape_with_playwright(url)
     
@@ -88,6 +323,15 @@ class WebScraper:
         try:
             from playwright.async_api import async_playwright
             
+            session_context = await self._get_browser_context()
+            if session_context is not None:
+                # Only the tab is per-URL; the browser lives for the session
+                page = await session_context.new_page()
+                try:
+                    return await self._render_page(page, url)
+                finally:
+                    await page.close()
+            
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=config.HEADLESS_BROWSER)
                 context = await browser.new_context(
@@ -96,26 +340,12 @@ class WebScraper:
                 page = await context.new_page()
                 
                 try:
-                    await page.goto(url, wait_until="networkidle", timeout=30000)
-                    await page.wait_for_timeout(2000)  # Wait for dynamic content
-                    
-                    html = await page.content()
-                    text = await page.evaluate("() => document.body.innerText")
-                    title = await page.title()
-                    
-                    return ScrapedPage(
-                        url=url,
-                        title=title,
-                        html_content=html,
-                        text_content=text,
-                        links=self._extract_links(html, url),
-                        success=True
-                    )
+                    return await self._render_page(page, url)
                 finally:
                     await browser.close()
                 
         except Exception as e:
-            logger.error(f"Playwright error for {url}: {e}")
+            logger.error("Playwright error for %s: %s", url, e)
             return ScrapedPage(
                 url=url,
                 title="",
@@ -125,15 +355,41 @@ class WebScraper:
                 error=str(e)
             )
     
-    def _extract_links(self, html: str, base_url: str) -> List[str]:
-        """Extract all links from HTML"""
-        links = []
-        href_pattern = re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
-        
+    async def _render_page(self, page, url: str) -> ScrapedPage:
+        """Load url in a Playwright page and capture its content"""
+        await page.goto(url, wait_until="networkidle", timeout=30000)
+        await page.wait_for_timeout(2000)  # Wait for dynamic content
+        
+        html = await page.content()
+        text = await page.evaluate("() => document.body.innerText")
+        title = await page.title()
+        
+        scraped = ScrapedPage(
+            url=url,
+            title=title,
+            html_content=html,
+            text_content=text,
+            success=True
+        )
+        scraped.links = self._extract_links(scraped)
+        return scraped
+    
+    def _extract_links(self, page: ScrapedPage) -> List[str]:
+        """Extract all same-domain links from a page's HTML"""
+        base_url = page.url
+        links: Set[str] = set()
+        seen_hrefs: Set[str] = set()
         base_domain = urlparse(base_url).netloc
-        
-        for match in href_pattern.finditer(html):
-            href = match.group(1)
+        # Same-domain test by prefix instead of urlparse per link; the
+        # delimiter keeps x.sch.id from matching x.sch.id.example.com
+        roots = (f"https://{base_domain}", f"http://{base_domain}")
+        same_domain_prefixes = tuple(root + sep for root in roots for sep in "/?#")
+        
+        for href in _page_hrefs(page):
+            # Repeated hrefs (menus, footers) resolve to the same URL
+            if href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
             
             # Skip anchors, javascript, mailto
             if href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
@@ -148,10 +404,10 @@ class WebScraper:
                 full_url = urljoin(base_url, href)
             
             # Only include same-domain links
-            if urlparse(full_url).netloc == base_domain:
-                links.append(full_url)
+            if full_url.startswith(same_domain_prefixes) or full_url in roots:
+                links.add(full_url)
         
-        return list(set(links))
+        return list(links)
     
     async def scrape_school_website(
         self, 
@@ -178,29 +434,45 @@ class WebScraper:
             max_pages = config.MAX_PAGES_PER_SCHOOL
         
         pages = []
-        to_visit = [base_url]
+        to_visit = deque([base_url])
+        # Everything ever added to to_visit, for O(1) "already queued" checks
+        queued: Set[str] = {base_url}
         domain = urlparse(base_url).netloc
         
-        # Reset visited URLs for this website
-        self.visited_urls = set()
+        # Track visited URLs locally so concurrent crawls don't share state
+        visited: Set[str] = set()
+        self.visited_urls = visited
         
         while to_visit and len(pages) < max_pages:
-            url = to_visit.pop(0)
-            
-            # Skip if already visited
-            if url in self.visited_urls:
-                continue
-            
-            self.visited_urls.add(url)
+            # Take the next wave of unvisited same-domain URLs
+            wave_size = min(self._page_concurrency, max_pages - len(pages))
+            wave: List[str] = []
+            while to_visit and len(wave) < wave_size:
+                url = to_visit.popleft()
+                
+                # Skip if already visited
+                if url in visited:
+                    continue
+                
+                visited.add(url)
+                
+                # Only scrape same domain
+                if urlparse(url).netloc != domain:
+                    continue
+                
+                wave.append(url)
             
-            # Only scrape same domain
-            if urlparse(url).netloc != domain:
-                continue
+            if not wave:
+                break
             
-            logger.info(f"  📄 Scraping: {url}")
-            page = await self.scrape_page(url)
+            # Fetch the wave in parallel; results come back in wave order
+            wave_pages = await asyncio.gather(
+                *(self._bounded_scrape(url) for url in wave)
+            )
             
-            if page.success:
+            for page in wave_pages:
+                if not page.success:
+                    continue
                 pages.append(page)
                 
                 # Prioritize important pages
@@ -208,26 +480,24 @@ class WebScraper:
                 other_links = []
                 
                 for link in page.links:
-                    link_lower = link.lower()
-                    if any(kw in link_lower for kw in config.PRIORITY_PAGES):
+                    if self._priority_re.search(link):
                         priority_links.append(link)
-                    elif link not in self.visited_urls:
+                    elif link not in visited:
                         other_links.append(link)
                 
                 # Add priority links first
                 for link in priority_links:
-                    if link not in self.visited_urls and link not in to_visit:
-                        to_visit.insert(0, link)
+                    if link not in visited and link not in queued:
+                        queued.add(link)
+                        to_visit.appendleft(link)
                 
                 # Add other links at the end
                 for link in other_links:
-                    if link not in self.visited_urls and link not in to_visit:
+                    if link not in visited and link not in queued:
+                        queued.add(link)
                         to_visit.append(link)
-            
-            # Rate limiting
-            await asyncio.sleep(self.delay)
         
-        logger.info(f"  ✓ Scraped {len(pages)} pages from {domain}")
+        logger.info("  ✓ Scraped %s pages from %s", len(pages), domain)
         return pages
     
     # ===========================================
@@ -245,123 +515,81 @@ class WebScraper:
         
         Returns normalized +62 format numbers
         """
-        whatsapp_numbers = []
-        
-        # wa.me links (most reliable)
-        wa_me_pattern = re.compile(r'wa\.me/(\d+)', re.IGNORECASE)
-        for match in wa_me_pattern.finditer(text):
-            num = match.group(1)
-            if num.startswith('62'):
-                whatsapp_numbers.append(f"+{num}")
-            else:
-                whatsapp_numbers.append(f"+62{num}")
-        
-        # api.whatsapp.com links
-        api_pattern = re.compile(r'api\.whatsapp\.com/send\?phone=(\d+)', re.IGNORECASE)
-        for match in api_pattern.finditer(text):
-            num = match.group(1)
-            if num.startswith('62'):
-                whatsapp_numbers.append(f"+{num}")
-            else:
-                whatsapp_numbers.append(f"+62{num}")
-        
-        # Indonesian phone numbers that might be WhatsApp
-        phone_pattern = re.compile(r'(?:WA|WhatsApp|Whatsapp)[:\s]*([+]?[\d\s\-()]+)', re.IGNORECASE)
-        for match in phone_pattern.finditer(text):
-            raw_num = re.sub(r'[^\d+]', '', match.group(1))
-            normalized = self._normalize_indonesian_phone(raw_num)
+        whatsapp_numbers: Set[str] = set()
+        
+        for match in _WHATSAPP_RE.finditer(_scan_window(text)):
+            label = match.group('label')
+            if label is None:
+                # wa.me / api.whatsapp.com links (most reliable)
+                num = match.group('wame') or match.group('api')
+                if num.startswith('62'):
+                    whatsapp_numbers.add(f"+{num}")
+                else:
+                    whatsapp_numbers.add(f"+62{num}")
+                continue
+            
+            # Indonesian phone numbers that might be WhatsApp
+            normalized = _normalize_indonesian_phone(label)
             if normalized:
-                whatsapp_numbers.append(normalized)
+                whatsapp_numbers.add(normalized)
         
-        return list(set(whatsapp_numbers))
+        return list(whatsapp_numbers)
     
     def extract_all_phone_numbers(self, text: str) -> List[str]:
         """Extract all Indonesian phone numbers from text"""
-        phones = []
-        
-        # Pattern for Indonesian phone numbers
-        patterns = [
-            r'(\+62[\d\s\-]{8,15})',           # +62 format
-            r'(62[\d\s\-]{8,15})',              # 62 format
-            r'(08[\d\s\-]{8,13})',              # 08xx format
-            r'(0\d{2,3}[\s\-]?\d{6,8})',        # Landline: 021-1234567
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, text):
-                raw = match.group(1)
-                normalized = self._normalize_indonesian_phone(raw)
+        phones: Set[str] = set()
+        
+        # Patterns for Indonesian phone numbers (see _PHONE_PATTERNS); each
+        # runs on its own, since a greedy match of one format may overlap
+        # a number another format would find
+        text = _scan_window(text)
+        for pattern in _PHONE_PATTERNS:
+            for match in pattern.finditer(text):
+                normalized = _normalize_indonesian_phone(match.group())
                 if normalized:
-                    phones.append(normalized)
-        
-        return list(set(phones))
-    
-    def _normalize_indonesian_phone(self, phone: str) -> Optional[str]:
-        """Normalize phone number to +62 format"""
-        if not phone:
-            return None
-        
-        # Remove all non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', phone)
-        
-        if len(cleaned) < 10:
-            return None
-        
-        # Convert to +62 format
-        if cleaned.startswith('08'):
-            return '+62' + cleaned[1:]
-        elif cleaned.startswith('62') and not cleaned.startswith('+'):
-            return '+' + cleaned
-        elif cleaned.startswith('+62'):
-            return cleaned
-        elif cleaned.startswith('0'):
-            # Landline
-            return '+62' + cleaned[1:]
+                    phones.add(normalized)
         
-        return None
+        return list(phones)
     
     def extract_emails(self, text: str) -> List[str]:
         """Extract email addresses from text"""
-        # Comprehensive email pattern
-        email_pattern = re.compile(
-            r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-            re.IGNORECASE
-        )
-        
-        emails = email_pattern.findall(text)
+        # Comprehensive email pattern (_EMAIL_RE)
+        emails = _EMAIL_RE.findall(_scan_window(text))
         
         # Filter out common false positives
-        filtered = []
-        skip_patterns = ['example.com', 'domain.com', 'email.com', 'test.com']
+        filtered: Set[str] = set()
         
         for email in emails:
             email_lower = email.lower()
-            if not any(skip in email_lower for skip in skip_patterns):
-                filtered.append(email.lower())
+            if not _SKIP_EMAIL_RE.search(email_lower):
+                filtered.add(email_lower)
         
-        return list(set(filtered))
+        return list(filtered)
     
-    def extract_social_media(self, html: str) -> dict:
-        """Extract social media links from HTML"""
+    def extract_social_media(self, page: Union[ScrapedPage, str]) -> dict:
+        """Extract social media links from a page (or raw HTML)"""
         social = {}
+        # Profile links live in href attributes; scan those, not the whole page
+        hrefs = _page_hrefs(page) if isinstance(page, ScrapedPage) else _parse_hrefs(page)
+        html = "\n".join(hrefs)
         
         # Instagram
-        ig_match = re.search(r'instagram\.com/([a-zA-Z0-9_.]+)', html, re.IGNORECASE)
+        ig_match = _IG_RE.search(html)
         if ig_match:
             social['instagram'] = f"@{ig_match.group(1)}"
         
         # Facebook
-        fb_match = re.search(r'facebook\.com/([a-zA-Z0-9.]+)', html, re.IGNORECASE)
+        fb_match = _FB_RE.search(html)
         if fb_match:
             social['facebook'] = f"https://facebook.com/{fb_match.group(1)}"
         
         # YouTube
-        yt_match = re.search(r'youtube\.com/(?:c/|channel/|@)([a-zA-Z0-9_-]+)', html, re.IGNORECASE)
+        yt_match = _YT_RE.search(html)
         if yt_match:
             social['youtube'] = f"https://youtube.com/{yt_match.group(0)}"
         
         # LinkedIn (company page)
-        li_match = re.search(r'linkedin\.com/(?:company|school)/([a-zA-Z0-9-]+)', html, re.IGNORECASE)
+        li_match = _LI_RE.search(html)
         if li_match:
             social['linkedin'] = f"https://linkedin.com/{li_match.group(0)}"
         
@@ -369,15 +597,16 @@ class WebScraper:
     
     def compile_scraped_content(self, pages: List[ScrapedPage]) -> str:
         """Compile all scraped pages into a single text for LLM processing"""
-        parts = []
-        
-        for page in pages:
-            if page.success and page.text_content:
-                parts.append(f"\n\n=== PAGE: {page.url} ===")
-                parts.append(f"Title: {page.title}")
-                parts.append(page.text_content[:8000])  # Limit per page
-        
-        return "\n".join(parts)
+        return "\n".join(
+            part
+            for page in pages
+            if page.success and page.text_content
+            for part in (
+                f"\n\n=== PAGE: {page.url} ===",
+                f"Title: {page.title}",
+                page.text_content[:8000],  # Limit per page
+            )
+        )
     
     # ===========================================
     # NEW: Tech Stack Detection
@@ -395,20 +624,41 @@ class WebScraper:
         Returns list of detected LMS platforms
         """
         detected_lms = []
+        # Not yet detected, in config order
+        remaining = list(config.LMS_INDICATORS)
         
         for page in pages:
+            if not remaining:
+                break  # Every LMS already found
             if not page.success:
                 continue
             
-            content = (page.html_content + " " + page.text_content).lower()
+            # Scan HTML, then text only if something is still missing
+            found: Set[str] = set()
+            for content in (page.html_lower, page.text_lower):
+                if _LMS_AUTOMATON is not None:
+                    found.update(
+                        lms_name
+                        for _, lms_names in _LMS_AUTOMATON.iter(content)
+                        for lms_name in lms_names
+                    )
+                else:
+                    for lms_name in remaining:
+                        if lms_name not in found and any(
+                            indicator.lower() in content
+                            for indicator in config.LMS_INDICATORS[lms_name]
+                        ):
+                            found.add(lms_name)
+                
+                if found.issuperset(remaining):
+                    break
             
-            for lms_name, indicators in config.LMS_INDICATORS.items():
-                if lms_name not in detected_lms:
-                    for indicator in indicators:
-                        if indicator.lower() in content:
-                            detected_lms.append(lms_name)
-                            logger.info(f"  🖥️ Detected LMS: {lms_name}")
-                            break
+            # Keep config order within a page
+            for lms_name in remaining:
+                if lms_name in found:
+                    detected_lms.append(lms_name)
+                    logger.info("  🖥️ Detected LMS: %s", lms_name)
+            remaining = [lms_name for lms_name in remaining if lms_name not in found]
         
         return detected_lms
     
@@ -445,74 +695,66 @@ class WebScraper:
             html = page.html_content
             
             # Find all link blocks with labels
-            link_patterns = [
-                r'(?:<[^>]*>)*\s*([^<>]{1,50})\s*(?:</[^>]*>)*\s*(?:<a[^>]*href=["\']([^"\']*wa\.me[^"\']*)["\'][^>]*>)',
-                r'(?:<a[^>]*href=["\']([^"\']*wa\.me[^"\']*)["\'][^>]*>)\s*(?:<[^>]*>)*\s*([^<>]{1,50})',
-            ]
-            
-            for pattern in link_patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE | re.DOTALL)
-                for match in matches:
-                    if len(match) == 2:
-                        label, url = match if 'wa.me' in match[1] else (match[1], match[0])
-                        label_clean = re.sub(r'\s+', ' ', label).strip()
-                        
-                        # Check for relevant labels
-                        role_keywords = ['principal', 'kepala', 'director', 'direktur', 
-                                       'admissions', 'admission', 'pendaftaran',
-                                       'contact', 'kontak', 'hubungi']
-                        
-                        for keyword in role_keywords:
-                            if keyword in label_clean.lower():
-                                result["contact_links"][label_clean] = url
-                                logger.info(f"  📱 Found labeled WhatsApp: {label_clean}")
-                                break
+            for label, url in self._wa_labeled_links(html):
+                label_clean = _WHITESPACE_RE.sub(' ', label).strip()
+                
+                # Check for relevant labels
+                if _ROLE_RE.search(label_clean):
+                    result["contact_links"][label_clean] = url
+                    logger.info("  📱 Found labeled WhatsApp: %s", label_clean)
             
-            logger.info(f"  ✓ Scraped Linktree: {len(wa_links)} WhatsApp links found")
+            logger.info("  ✓ Scraped Linktree: %s WhatsApp links found", len(wa_links))
             
         except Exception as e:
-            logger.error(f"Linktree scraping error for {linktree_url}: {e}")
+            logger.error("Linktree scraping error for %s: %s", linktree_url, e)
         
         return result
     
+    def _wa_labeled_links(self, html: str) -> List[Tuple[str, str]]:
+        """(label, wa.me URL) pairs; the label is the anchor text when parsed"""
+        if SELECTOLAX_AVAILABLE:
+            pairs = []
+            for node in HTMLParser(html).css("a[href]"):
+                url = node.attributes.get("href") or ""
+                if "wa.me" in url:
+                    pairs.append((node.text(separator=" "), url))
+            return pairs
+        
+        pairs = []
+        for pattern in _WA_LABEL_PATTERNS:
+            for match in pattern.findall(html):
+                if len(match) == 2:
+                    pairs.append(match if 'wa.me' in match[1] else (match[1], match[0]))
+        return pairs
+    
     # ===========================================
     # NEW: PDF Text Extraction
     # ===========================================
     
     def find_pdf_links(self, pages: List[ScrapedPage]) -> List[str]:
         """Find PDF links that might contain organization structure"""
-        pdf_links = []
-        
-        structure_keywords = [
-            'struktur', 'organisasi', 'organization', 'structure',
-            'pengurus', 'board', 'yayasan', 'foundation',
-            'about', 'tentang', 'profil', 'profile'
-        ]
+        pdf_links: Set[str] = set()
         
         for page in pages:
             if not page.success:
                 continue
             
             # Find all PDF links
-            pdf_pattern = re.compile(r'href=["\']([^"\']+\.pdf)["\']', re.IGNORECASE)
-            
-            for match in pdf_pattern.finditer(page.html_content):
-                pdf_url = match.group(1)
-                pdf_url_lower = pdf_url.lower()
+            for pdf_url in _page_hrefs(page):
+                if not pdf_url.lower().endswith('.pdf'):
+                    continue
                 
                 # Check if PDF is related to organization structure
-                for keyword in structure_keywords:
-                    if keyword in pdf_url_lower:
-                        # Convert relative URL to absolute
-                        if not pdf_url.startswith('http'):
-                            base = urlparse(page.url)
-                            pdf_url = f"{base.scheme}://{base.netloc}{pdf_url if pdf_url.startswith('/') else '/' + pdf_url}"
-                        
-                        pdf_links.append(pdf_url)
-                        logger.info(f"  📄 Found structure PDF: {pdf_url}")
-                        break
-        
-        return list(set(pdf_links))
+                if _STRUCTURE_RE.search(pdf_url):
+                    # Convert relative URL to absolute
+                    if not pdf_url.startswith('http'):
+                        base = urlparse(page.url)
+                        pdf_url = f"{base.scheme}://{base.netloc}{pdf_url if pdf_url.startswith('/') else '/' + pdf_url}"
+                    
+                    pdf_links.add(pdf_url)
+                    logger.info("  📄 Found structure PDF: %s", pdf_url)
+        
+        return list(pdf_links)
     
     async def extract_pdf_text(self, pdf_url: str) -> str:
         """
@@ -522,27 +764,21 @@ class WebScraper:
         Returns extracted text or empty string on failure
         """
         try:
-            import httpx
             import fitz  # PyMuPDF
             
-            # Download PDF
-            async with httpx.AsyncClient() as client:
-                response = await client.get(pdf_url, timeout=30.0, follow_redirects=True)
-                response.raise_for_status()
-                pdf_bytes = response.content
-            
-            # Extract text using PyMuPDF
-            pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-            text_parts = []
-            
-            for page_num in range(min(pdf_document.page_count, 10)):  # Limit to first 10 pages
-                page = pdf_document[page_num]
-                text_parts.append(page.get_text())
-            
-            pdf_document.close()
+            # Download PDF straight into one buffer (no extra bytes copy)
+            buffer = io.BytesIO()
+            async with self._http() as client:
+                async with client.stream(
+                    "GET", pdf_url, timeout=30.0, follow_redirects=True
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(65536):
+                        buffer.write(chunk)
             
-            extracted_text = "\n".join(text_parts)
-            logger.info(f"  ✓ Extracted {len(extracted_text)} chars from PDF")
+            # PyMuPDF parsing is synchronous C work; keep it off the event loop
+            extracted_text = await asyncio.to_thread(self._read_pdf_text, fitz, buffer)
+            logger.info("  ✓ Extracted %s chars from PDF", len(extracted_text))
             
             return extracted_text
             
@@ -550,9 +786,21 @@ class WebScraper:
             logger.warning("PyMuPDF (fitz) not installed. PDF extraction disabled.")
             return ""
         except Exception as e:
-            logger.error(f"PDF extraction error for {pdf_url}: {e}")
+            logger.error("PDF extraction error for %s: %s", pdf_url, e)
             return ""
     
+    @staticmethod
+    def _read_pdf_text(fitz, buffer: io.BytesIO) -> str:
+        """Extract text from the first 10 pages of an in-memory PDF"""
+        pdf_document = fitz.open(stream=buffer, filetype="pdf")
+        try:
+            return "\n".join(
+                pdf_document[page_num].get_text()
+                for page_num in range(min(pdf_document.page_count, 10))  # Limit to first 10 pages
+            )
+        finally:
+            pdf_document.close()
+    
     # ===========================================
     # NEW: Google Maps Data Fetching
     # ===========================================
@@ -584,10 +832,8 @@ class WebScraper:
             }
         """
         try:
-            import httpx
-            
             # Use Serper's Google Maps search
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 response = await client.post(
                     "https://google.serper.dev/places",
                     headers={
@@ -631,7 +877,7 @@ class WebScraper:
                                     "source": "google_maps"
                                 }
         except Exception as e:
-            logger.error(f"Google Maps fetch error: {e}")
+            logger.error("Google Maps fetch error: %s", e)
         
         return None
 
@@ -3,15 +3,144 @@ Serper.dev Google Search API integration for Indonesia EdTech Lead Gen Engine
 """
 import httpx
 import asyncio
+import contextlib
+import hashlib
 import re
-from typing import List, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional, Pattern, Set, Tuple
 from config import config
 from models import SearchResult
 import logging
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Single-pass scan for facts in compiled search text (see SerperSearch.extract_facts)
+_FACTS_RE = re.compile(
+    r'(?:NPSN|Nomor\s+Pokok\s+Sekolah)\s*[:\s]\s*(?P<npsn>\d{8})'
+    r'|(?P<email>[\w.+-]+@[\w-]+\.[\w.-]*\w)'
+    r'|(?P<website>https?://[^\s/]+\.(?:sch|ac)\.id\S*)'
+    r'|(?P<phone>(?:\+62[\s\-]?|\b0)[1-9][\d\s\-]{7,13}\d)',
+    re.IGNORECASE
+)
+_MAX_FACTS = 10  # Per fact type
+
+# Social media and directory domains that are never the school's own site
+_SKIP_RE = re.compile(
+    r'linkedin\.com|facebook\.com|instagram\.com|twitter\.com|youtube\.com|tiktok\.com'
+    r'|kemdikbud\.go\.id'  # Ministry site, not school site
+    r'|wikipedia\.org|tripadvisor|google\.com',
+    re.IGNORECASE
+)
+# Indonesian school / academic domains
+_PREF_RE = re.compile(r'\.sch\.id|\.ac\.id', re.IGNORECASE)
+
+# NPSN extraction (see NPSNLookup._scan_npsn), in priority order
+# Labelled NPSN ("NPSN: 20100000", "20100000 NPSN") as one alternation
+_NPSN_LABELED = re.compile(
+    r'(?:NPSN|Nomor\s+Pokok\s+Sekolah)\s*[:\s]\s*(\d{8})'
+    r'|\b(\d{8})\b(?=\s*(?:NPSN|npsn))',
+    re.IGNORECASE
+)
+_EIGHT_DIGIT = re.compile(r'\b(\d{8})\b')
+
+# Kemdikbud profile fields in one scan (see NPSNLookup.parse_kemdikbud_data)
+_KMD_RE = re.compile(
+    r'Kepala\s+Sekolah\s*[:\s]+(?P<principal_name>[^<\n]+)'
+    r'|Alamat\s*[:\s]+(?P<address>[^<\n]+)'
+    r'|(?P<email>[\w.+-]+@[\w-]+\.[\w.-]+)',
+    re.IGNORECASE
+)
+_EMAIL = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+
+# Linktree-style bio link hosts, as one alternation
+_BIO_RE = re.compile(
+    r'(?:https?://)?(?:linktr\.ee|bio\.fm|beacons\.ai|linkin\.bio'
+    r'|campsite\.bio|lnk\.to|msha\.ke|tap\.bio)/[\w.-]+',
+    re.IGNORECASE
+)
+
+# Profile URL discriminators
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/', re.IGNORECASE)
+_INSTA_RE = re.compile(r'instagram\.com/', re.IGNORECASE)
+
+# Result categories searched for the official website, in priority order
+_WEBSITE_KEYS = ("website", "contacts", "local", "foundation")
+
+# Seconds a Serper response is reused for an identical request
+_SEARCH_CACHE_TTL = 600.0
+_SEARCH_CACHE_MAX = 2048  # Entries kept per SerperSearch (oldest evicted first)
+
+# NPSN extraction results keyed by a digest of the scanned text (FIFO-bounded)
+_NPSN_CACHE_MAX = 4096
+_npsn_cache: Dict[bytes, Optional[str]] = {}
+
+
+class _RateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per `period` seconds
+    
+    Used as `async with limiter:`; a full bucket permits a burst of `rate`,
+    after which acquisitions are spaced period/rate apart.
+    """
+    
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = max(1, rate)
+        self.period = period
+        self._tokens = float(self.rate)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> "_RateLimiter":
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate, self._tokens + (now - self._last) * self.rate / self.period
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+    
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def _pooled_client(keepalive_expiry: float = 30.0, **kwargs) -> httpx.AsyncClient:
+    """Keep-alive client used when no shared client was injected"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=32, max_connections=64,
+            keepalive_expiry=keepalive_expiry
+        ),
+        **kwargs
+    )
+
 
 class SerperSearch:
     """
@@ -32,8 +161,36 @@ class SerperSearch:
             "X-API-KEY": self.api_key,
             "Content-Type": "application/json"
         }
-        self.rate_limiter = asyncio.Semaphore(config.REQUESTS_PER_MINUTE)
+        # Requests per minute (token bucket) and requests in flight, separately
+        self.rate_limiter = _RateLimiter(config.REQUESTS_PER_MINUTE, 60.0)
+        self._in_flight = asyncio.Semaphore(max(1, config.MAX_CONCURRENT_SEARCHES))
         self._request_count = 0
+        self.client: Optional[httpx.AsyncClient] = None
+        # Created on first use when no shared client is injected; the engine
+        # closes it via LeadEnrichmentEngine.aclose()
+        self._own_client: Optional[httpx.AsyncClient] = None
+        # (query, num, gl, hl) -> (created, future of results); in-flight
+        # duplicates await the same future instead of re-requesting. Kept in
+        # creation order, so expired entries are always at the front
+        self._cache: "OrderedDict[Tuple[str, int, str, str], Tuple[float, asyncio.Future]]" = OrderedDict()
+    
+    def _http(self):
+        """Shared client when the engine provides one, else this instance's pool"""
+        if self.client is not None:
+            return contextlib.nullcontext(self.client)
+        if self._own_client is None or self._own_client.is_closed:
+            # Serper speaks HTTP/2: a whole gather() batch multiplexes over
+            # one TLS connection instead of queueing for pooled sockets
+            self._own_client = _pooled_client(
+                keepalive_expiry=60.0, http2=HTTP2_AVAILABLE
+            )
+        return contextlib.nullcontext(self._own_client)
+    
+    async def aclose(self):
+        """Close this instance's own connection pool, if one was opened"""
+        if self._own_client is not None:
+            await self._own_client.aclose()
+            self._own_client = None
     
     async def search(
         self, 
@@ -53,10 +210,51 @@ class SerperSearch:
             
         Returns:
             List of SearchResult objects
+        
+        Identical requests within _SEARCH_CACHE_TTL share one API call;
+        failed requests are not cached.
         """
-        async with self.rate_limiter:
+        key = (query, num_results, gl, hl)
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None:
+            created, future = entry
+            if now - created <= _SEARCH_CACHE_TTL:
+                return list(await future)
+            del self._cache[key]
+        
+        future = asyncio.get_running_loop().create_future()
+        self._cache_insert(key, now, future)
+        results = None
+        try:
+            results = await self._search_uncached(query, num_results, gl, hl)
+        finally:
+            if results is None:
+                # Error or cancellation: let the next caller retry
+                if self._cache.get(key, (None, None))[1] is future:
+                    del self._cache[key]
+                future.set_result([])
+            else:
+                future.set_result(results)
+        return list(results) if results is not None else []
+    
+    def _cache_insert(self, key: Tuple[str, int, str, str], now: float, future: asyncio.Future):
+        """Add a cache entry, sweeping expired ones and evicting beyond _SEARCH_CACHE_MAX"""
+        cache = self._cache
+        while cache:
+            created, _ = next(iter(cache.values()))
+            if now - created <= _SEARCH_CACHE_TTL and len(cache) < _SEARCH_CACHE_MAX:
+                break
+            cache.popitem(last=False)
+        cache[key] = (now, future)
+    
+    async def _search_uncached(
+        self, query: str, num_results: int, gl: str, hl: str
+    ) -> Optional[List[SearchResult]]:
+        """One Serper request; None on failure"""
+        async with self.rate_limiter, self._in_flight:
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._http() as client:
                     response = await client.post(
                         self.BASE_URL,
                         headers=self.headers,
@@ -69,7 +267,11 @@ class SerperSearch:
                         timeout=config.REQUEST_TIMEOUT
                     )
                     response.raise_for_status()
-                    data = response.json()
+                    # orjson decodes the raw bytes in C, skipping the text decode
+                    data = (
+                        orjson.loads(response.content) if ORJSON_AVAILABLE
+                        else response.json()
+                    )
                     
                     self._request_count += 1
                     
@@ -88,10 +290,10 @@ class SerperSearch:
                     
             except httpx.HTTPStatusError as e:
                 logger.error(f"HTTP error for '{query}': {e.response.status_code}")
-                return []
+                return None
             except Exception as e:
                 logger.error(f"Search error for '{query}': {e}")
-                return []
+                return None
     
     async def search_dapodik(self, school_name: str, npsn: Optional[str] = None) -> List[SearchResult]:
         """
@@ -119,13 +321,11 @@ class SerperSearch:
         queries.append(f'site:sekolah.data.kemdikbud.go.id "{school_name}" profil')
         queries.append(f'site:dapodik.kemdikbud.go.id "{school_name}"')
         
-        all_results = []
-        for query in queries:
-            results = await self.search(query, num_results=5)
-            all_results.extend(results)
-            await asyncio.sleep(0.3)
-        
-        return all_results
+        # Independent queries: run them together (search() applies the rate limit)
+        batches = await asyncio.gather(
+            *(self.search(query, num_results=5) for query in queries)
+        )
+        return [result for batch in batches for result in batch]
     
     async def search_school(self, school_name: str, location: str = "", npsn: Optional[str] = None) -> Dict[str, List[SearchResult]]:
         """
@@ -145,8 +345,6 @@ class SerperSearch:
         Returns:
             Dict with search categories as keys, SearchResult lists as values
         """
-        results = {}
-        
         # Build search queries from templates - EXPANDED for max contacts
         queries = {
             "official_data": config.SEARCH_TEMPLATES["official_data"].format(school_name=school_name),
@@ -171,30 +369,49 @@ class SerperSearch:
                 location=location
             )
         
-        # Execute searches with small delays to be respectful
-        for key, query in queries.items():
-            results[key] = await self.search(query)
-            await asyncio.sleep(0.3)  # Small delay between queries
-        
-        # NEW: DAPODIK search
-        results["dapodik"] = await self.search_dapodik(school_name, npsn)
+        # Execute all searches concurrently; search() applies the rate limit
+        keys = list(queries)
+        values = await asyncio.gather(
+            *(self.search(queries[key]) for key in keys),
+            # NEW: DAPODIK search
+            self.search_dapodik(school_name, npsn)
+        )
+        results = dict(zip(keys, values))
+        results["dapodik"] = values[-1]
         
         return results
     
     def compile_results_text(self, results: Dict[str, List[SearchResult]]) -> str:
         """Compile all search results into a single text for LLM processing"""
-        text_parts = []
-        
-        for category, items in results.items():
-            if items:
-                text_parts.append(f"\n=== {category.upper().replace('_', ' ')} ===")
+        def parts():
+            for category, items in results.items():
+                if not items:
+                    continue
+                yield f"\n=== {category.upper().replace('_', ' ')} ==="
                 for item in items:
-                    text_parts.append(f"Title: {item.title}")
-                    text_parts.append(f"URL: {item.url}")
-                    text_parts.append(f"Snippet: {item.snippet}")
-                    text_parts.append("")
+                    # One block per result, blank line after
+                    yield f"Title: {item.title}\nURL: {item.url}\nSnippet: {item.snippet}\n"
+        
+        return "\n".join(parts())
+    
+    def extract_facts(self, text: str) -> Dict[str, List[str]]:
+        """
+        Pull NPSNs, emails, school websites and phone numbers from compiled
+        search text in one regex pass
+        
+        Returns dict of fact type -> unique values (first seen first)
+        """
+        facts: Dict[str, Dict[str, None]] = {
+            "npsn": {}, "email": {}, "website": {}, "phone": {}
+        }
+        
+        for match in _FACTS_RE.finditer(text):
+            kind = match.lastgroup
+            values = facts[kind]
+            if len(values) < _MAX_FACTS:
+                values[match.group(kind).strip()] = None
         
-        return "\n".join(text_parts)
+        return {kind: list(values) for kind, values in facts.items()}
     
     def find_official_website(self, results: Dict[str, List[SearchResult]]) -> Optional[str]:
         """
@@ -205,85 +422,112 @@ class SerperSearch:
         2. .ac.id domains (Indonesian academic domain)
         3. First non-social-media result
         """
-        all_urls = []
+        all_urls: List[str] = []
         
         # Collect all URLs, prioritizing contacts and website searches
-        for key in ["website", "contacts", "local", "foundation"]:
+        for key in _WEBSITE_KEYS:
             items = results.get(key, [])
             for item in items:
                 all_urls.append(item.url)
         
-        # Social media and directory domains to skip
-        skip_domains = [
-            'linkedin.com', 'facebook.com', 'instagram.com', 
-            'twitter.com', 'youtube.com', 'tiktok.com',
-            'kemdikbud.go.id',  # Ministry site, not school site
-            'wikipedia.org',
-            'tripadvisor',
-            'google.com',
-        ]
-        
-        # First pass: look for .sch.id or .ac.id
+        # One pass: first .sch.id/.ac.id URL wins, else the first non-social URL
+        fallback: Optional[str] = None
         for url in all_urls:
-            url_lower = url.lower()
-            if any(skip in url_lower for skip in skip_domains):
+            if _SKIP_RE.search(url):
                 continue
-            if '.sch.id' in url_lower or '.ac.id' in url_lower:
-                return url
-        
-        # Second pass: any non-social URL
-        for url in all_urls:
-            url_lower = url.lower()
-            if not any(skip in url_lower for skip in skip_domains):
+            if _PREF_RE.search(url):
                 return url
+            if fallback is None:
+                fallback = url
         
-        return None
+        return fallback
     
     def find_linkedin_profiles(self, results: Dict[str, List[SearchResult]]) -> List[SearchResult]:
         """Extract LinkedIn profile results"""
-        linkedin_results = []
+        return self._collect_matching(results, _LINKEDIN_RE)
+    
+    def _collect_matching(
+        self, results: Dict[str, List[SearchResult]], pattern: Pattern[str]
+    ) -> List[SearchResult]:
+        """First result per unique URL matching pattern, across all categories"""
+        seen: Dict[str, SearchResult] = {}
         
-        for key, items in results.items():
+        for items in results.values():
             for item in items:
-                if 'linkedin.com/in/' in item.url.lower():
-                    linkedin_results.append(item)
+                url = item.url
+                if url not in seen and pattern.search(url):
+                    seen[url] = item
         
-        return linkedin_results
+        return list(seen.values())
     
     def find_linktree_urls(self, results: Dict[str, List[SearchResult]]) -> List[str]:
         """Extract Linktree/Bio.fm URLs from Instagram search results"""
-        linktree_urls = []
-        bio_patterns = [
-            'linktr.ee', 'bio.fm', 'beacons.ai', 'linkin.bio',
-            'campsite.bio', 'lnk.to', 'msha.ke', 'tap.bio'
-        ]
+        linktree_urls: Set[str] = set()
         
         for key, items in results.items():
             for item in items:
-                # Check snippet for bio link URLs
-                for pattern in bio_patterns:
-                    if pattern in item.snippet.lower():
-                        # Try to extract full URL from snippet
-                        import re
-                        url_match = re.search(rf'(https?://)?{pattern}/[\w.-]+', item.snippet, re.IGNORECASE)
-                        if url_match:
-                            url = url_match.group(0)
-                            if not url.startswith('http'):
-                                url = 'https://' + url
-                            linktree_urls.append(url)
-        
-        return list(set(linktree_urls))
+                # Check snippet for bio link URLs (one scan for every host)
+                for url_match in _BIO_RE.finditer(item.snippet):
+                    url = url_match.group(0)
+                    if not url.startswith('http'):
+                        url = 'https://' + url
+                    linktree_urls.add(url)
+        
+        return list(linktree_urls)
     
     def find_instagram_profiles(self, results: Dict[str, List[SearchResult]]) -> List[str]:
         """Extract Instagram profile URLs"""
-        instagram_urls = []
+        return [item.url for item in self._collect_matching(results, _INSTA_RE)]
+    
+    def classify_results(self, results: Dict[str, List[SearchResult]]) -> Dict:
+        """
+        find_official_website, find_linkedin_profiles, find_instagram_profiles
+        and find_linktree_urls in a single walk over the results
+        
+        Returns:
+            {"official_website": Optional[str], "linkedin": List[SearchResult],
+             "instagram": List[str], "linktree": List[str]}
+        """
+        # First preferred / first non-social URL per website category; the
+        # priority order across categories is applied once the walk is done
+        preferred: Dict[str, str] = {}
+        fallback: Dict[str, str] = {}
+        linkedin: Dict[str, SearchResult] = {}
+        instagram: Dict[str, SearchResult] = {}
+        linktree_urls: Set[str] = set()
         
         for key, items in results.items():
+            website_key = key in _WEBSITE_KEYS
             for item in items:
-                if 'instagram.com/' in item.url.lower():
-                    instagram_urls.append(item.url)
-        
-        return list(set(instagram_urls))
+                url = item.url
+                
+                if website_key and key not in preferred and not _SKIP_RE.search(url):
+                    if _PREF_RE.search(url):
+                        preferred[key] = url
+                    elif key not in fallback:
+                        fallback[key] = url
+                
+                if url not in linkedin and _LINKEDIN_RE.search(url):
+                    linkedin[url] = item
+                if url not in instagram and _INSTA_RE.search(url):
+                    instagram[url] = item
+                
+                for url_match in _BIO_RE.finditer(item.snippet):
+                    bio_url = url_match.group(0)
+                    if not bio_url.startswith('http'):
+                        bio_url = 'https://' + bio_url
+                    linktree_urls.add(bio_url)
+        
+        official = next((preferred[k] for k in _WEBSITE_KEYS if k in preferred), None)
+        if official is None:
+            official = next((fallback[k] for k in _WEBSITE_KEYS if k in fallback), None)
+        
+        return {
+            "official_website": official,
+            "linkedin": list(linkedin.values()),
+            "instagram": list(instagram),
+            "linktree": list(linktree_urls)
+        }
     
     @property
     def requests_made(self) -> int:
@@ -302,6 +546,26 @@ class NPSNLookup:
     # Note: These are example URLs. The actual API may require different endpoints.
     KEMDIKBUD_SEARCH = "https://referensi.data.kemdikbud.go.id/pendidikan/dikdas"
     
+    # Shared connection pool, set by the engine for the duration of a batch
+    client: Optional[httpx.AsyncClient] = None
+    # Created on first use when no shared client is injected; the engine
+    # closes it via LeadEnrichmentEngine.aclose()
+    _own_client: Optional[httpx.AsyncClient] = None
+    
+    def _http(self):
+        """Shared client when the engine provides one, else this instance's pool"""
+        if self.client is not None:
+            return contextlib.nullcontext(self.client)
+        if self._own_client is None or self._own_client.is_closed:
+            self._own_client = _pooled_client(follow_redirects=True)
+        return contextlib.nullcontext(self._own_client)
+    
+    async def aclose(self):
+        """Close this instance's own connection pool, if one was opened"""
+        if self._own_client is not None:
+            await self._own_client.aclose()
+            self._own_client = None
+    
     def extract_npsn_from_text(self, text: str) -> Optional[str]:
         """
         Extract NPSN code from text
@@ -311,23 +575,33 @@ class NPSNLookup:
         - 10xxxxxx: Sumatra
         - 30xxxxxx: Kalimantan
         - etc.
+        
+        Results are memoized on a digest of the text, so rescanning the same
+        (possibly large) search text is a dict lookup.
         """
-        # Look for explicit NPSN labels
-        npsn_patterns = [
-            r'NPSN\s*[:\s]\s*(\d{8})',
-            r'Nomor\s+Pokok\s+Sekolah\s*[:\s]\s*(\d{8})',
-            r'\b(\d{8})\b(?=\s*(?:NPSN|npsn))',
-        ]
-        
-        for pattern in npsn_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1)
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        if key in _npsn_cache:
+            return _npsn_cache[key]
+        
+        npsn = self._scan_npsn(text)
+        
+        if len(_npsn_cache) >= _NPSN_CACHE_MAX:
+            _npsn_cache.pop(next(iter(_npsn_cache)))
+        _npsn_cache[key] = npsn
+        
+        return npsn
+    
+    def _scan_npsn(self, text: str) -> Optional[str]:
+        """Run the NPSN regexes over text (uncached)"""
+        # Look for explicit NPSN labels (first labelled number wins)
+        match = _NPSN_LABELED.search(text)
+        if match:
+            return match.group(1) or match.group(2)
         
         # Fallback: Look for any 8-digit number that could be NPSN
-        # (less reliable, but useful as backup)
-        eight_digit = re.findall(r'\b(\d{8})\b', text)
-        for num in eight_digit:
+        # (less reliable, but useful as backup); stop at the first candidate
+        for match in _EIGHT_DIGIT.finditer(text):
+            num = match.group(1)
             # NPSN typically starts with 1, 2, or 3 (Indonesian regions)
             if num[0] in '123':
                 return num
@@ -345,7 +619,7 @@ class NPSNLookup:
             return None
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http() as client:
                 # Try the referensi data API
                 response = await client.get(
                     f"https://referensi.data.kemdikbud.go.id/pendidikan/dikdas/detail/{npsn}",
@@ -367,34 +641,59 @@ class NPSNLookup:
         return None
     
     def parse_kemdikbud_data(self, html: str) -> Dict:
-        """Parse school data from Kemdikbud HTML page"""
-        data = {}
+        """
+        Parse school data from Kemdikbud HTML page
         
-        # Extract principal name
-        principal_match = re.search(
-            r'Kepala\s+Sekolah\s*[:\s]+([^<\n]+)', 
-            html, 
-            re.IGNORECASE
-        )
-        if principal_match:
-            data['principal_name'] = principal_match.group(1).strip()
-        
-        # Extract address
-        address_match = re.search(
-            r'Alamat\s*[:\s]+([^<\n]+)', 
-            html, 
-            re.IGNORECASE
-        )
-        if address_match:
-            data['address'] = address_match.group(1).strip()
+        Reads the profile's label/value table rows when selectolax is
+        installed; fields not found there come from a regex scan of the HTML.
+        """
+        data = self._parse_kemdikbud_table(html) if SELECTOLAX_AVAILABLE else {}
+        if len(data) == 3:
+            return data
+        
+        # First principal name, address and email, in a single pass
+        for match in _KMD_RE.finditer(html):
+            field = match.lastgroup
+            value = match.group(field)
+            if field == 'email':
+                data.setdefault('email', value)
+            else:
+                data.setdefault(field, value.strip())
+                # A labelled line can swallow the email ("Alamat Email: ...")
+                if 'email' not in data:
+                    email_match = _EMAIL.search(value)
+                    if email_match:
+                        data['email'] = email_match.group(0)
+            if len(data) == 3:
+                break
         
-        # Extract email
-        email_match = re.search(
-            r'[\w.+-]+@[\w-]+\.[\w.-]+', 
-            html
-        )
-        if email_match:
-            data['email'] = email_match.group(0)
+        return data
+    
+    def _parse_kemdikbud_table(self, html: str) -> Dict:
+        """Principal, address and email from <tr><td>label</td>...<td>value</td> rows"""
+        data = {}
+        
+        for row in HTMLParser(html).css("tr"):
+            cells = row.css("td")
+            if len(cells) < 2:
+                continue
+            label = cells[0].text(strip=True).lower()
+            # Value is the last cell; some layouts put ":" in a cell of its own
+            value = cells[-1].text(strip=True).lstrip(": ").strip()
+            if not value:
+                continue
+            
+            if 'email' in label:
+                email_match = _EMAIL.search(value)
+                if email_match:
+                    data.setdefault('email', email_match.group(0))
+            elif 'kepala sekolah' in label:
+                data.setdefault('principal_name', value)
+            elif label.startswith('alamat'):
+                data.setdefault('address', value)
+            
+            if len(data) == 3:
+                break
         
         return data
 
@@ -0,0 +1,19 @@
+"""
+Regression tests for WebScraper text extraction
+"""
+from scraper import WebScraper
+
+
+def test_adjacent_phone_numbers_are_both_found():
+    # A greedy 62... match may run across the newline into the 08... number;
+    # the 08 number must still be found on its own
+    text = "Telp: 6281234567890\n08123456789"
+    phones = WebScraper().extract_all_phone_numbers(text)
+    assert "+628123456789" in phones
+
+
+def test_adjacent_phone_numbers_on_one_line():
+    text = "Hubungi 0812-3456-7890 / 021 5551234"
+    phones = WebScraper().extract_all_phone_numbers(text)
+    assert "+6281234567890" in phones
+    assert "+62215551234" in phones
@@ -4,12 +4,16 @@ Validates WhatsApp numbers and email addresses
 """
 import re
 import asyncio
-import socket
-from typing import Optional, Dict
+import contextlib
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from email_validator import validate_email, EmailNotValidError
 import httpx
 import logging
 
+from models import _clean_phone, _to_plus62
+
 try:
     import dns.resolver
     DNS_AVAILABLE = True
@@ -17,9 +21,37 @@ except ImportError:
     DNS_AVAILABLE = False
     logging.warning("dnspython not installed. MX record checks will be limited.")
 
+try:
+    import aiodns  # Non-blocking c-ares resolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_MOBILE_RE = re.compile(r'^\+628\d{8,10}$')   # Indonesian mobile, +62 format
+
+# Entries kept per verification cache (least recently used are evicted)
+_CACHE_MAX = 50_000
+_MISSING = object()
+
+# Seconds a failed per-domain lookup (no MX hosts, no SMTP reply) is reused
+_FAILURE_TTL = 300.0
+
+# SMTP probe: whole-exchange timeout, MX hosts tried per domain, and
+# port-25 sockets open at once across all verifications
+_SMTP_TIMEOUT = 3.0
+_SMTP_MAX_HOSTS = 3
+_SMTP_MAX_CONNECTIONS = 20
+
+# Local-part prefixes of shared (non-personal) mailboxes, for str.startswith
+_GENERAL_PREFIXES = (
+    "info", "admin", "contact", "support", "help", 
+    "noreply", "no-reply", "mail", "webmaster",
+    "kontak", "hubungi"
+)
+
 
 class ContactValidator:
     """
@@ -30,8 +62,74 @@ class ContactValidator:
     """
     
     def __init__(self):
-        self.whatsapp_cache: Dict[str, bool] = {}
-        self.email_cache: Dict[str, Dict[str, bool]] = {}
+        # Bounded LRUs: the validator is a process-wide singleton
+        self.whatsapp_cache: "OrderedDict[str, bool]" = OrderedDict()
+        self.email_cache: "OrderedDict[str, Dict[str, bool]]" = OrderedDict()
+        self._resolver = None  # aiodns.DNSResolver, created on first MX lookup
+        self._resolver_loop = None
+        # Per-domain lookups shared by every address on the domain, as
+        # (task, failure expiry); holding the task lets concurrent
+        # verifications await one lookup
+        self._mx_cache: "OrderedDict[str, Tuple[asyncio.Future, Optional[float]]]" = OrderedDict()
+        self._smtp_cache: "OrderedDict[str, Tuple[asyncio.Future, Optional[float]]]" = OrderedDict()
+        self._smtp_slots: Optional[asyncio.Semaphore] = None
+        self._smtp_slots_loop = None
+    
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: str, default=None):
+        """LRU lookup: a hit becomes the most recently used entry"""
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        cache.move_to_end(key)
+        return value
+    
+    @staticmethod
+    def _cache_set(cache: OrderedDict, key: str, value) -> None:
+        """LRU insert, evicting the oldest entry beyond _CACHE_MAX"""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _CACHE_MAX:
+            cache.popitem(last=False)
+    
+    async def _coalesce(
+        self,
+        cache: OrderedDict,
+        key: str,
+        make: Callable[[], Awaitable]
+    ):
+        """
+        Run make() once per key and share its result with every caller
+        
+        Falsy results ([] MX hosts, a failed handshake) are reused for only
+        _FAILURE_TTL seconds, so a transient DNS/SMTP error gets retried.
+        """
+        entry = self._cache_get(cache, key)
+        if entry is not None:
+            future, expires = entry
+            if future.done():
+                if expires is None or time.monotonic() < expires:
+                    return future.result()
+            elif future.get_loop() is asyncio.get_running_loop():
+                return await future
+            # (else expired, or a pending task from another event loop that
+            # can't be awaited here: run make() again)
+        
+        future = asyncio.ensure_future(make())
+        future.add_done_callback(lambda done: self._expire_failure(cache, key, done))
+        self._cache_set(cache, key, (future, None))
+        return await future
+    
+    @staticmethod
+    def _expire_failure(cache: OrderedDict, key: str, future: asyncio.Future) -> None:
+        """Give a failed lookup a short lifetime (errors are dropped outright)"""
+        entry = cache.get(key)
+        if entry is None or entry[0] is not future:
+            return
+        if future.cancelled() or future.exception() is not None:
+            del cache[key]
+        elif not future.result():
+            cache[key] = (future, time.monotonic() + _FAILURE_TTL)
     
     async def verify_whatsapp(
         self, 
@@ -71,8 +169,9 @@ class ContactValidator:
             result["is_mobile"] = True
         
         # Check cache first
-        if normalized in self.whatsapp_cache:
-            result["exists"] = self.whatsapp_cache[normalized]
+        cached = self._cache_get(self.whatsapp_cache, normalized)
+        if cached is not None:
+            result["exists"] = cached
             return result
         
         if use_api:
@@ -86,14 +185,13 @@ class ContactValidator:
             # - Landline: +62xxxxxxxxx (but less common for WhatsApp)
             
             # Basic validation: Indonesian mobile format
-            mobile_pattern = r'^\+628\d{8,10}$'
-            if re.match(mobile_pattern, normalized.replace(" ", "")):
+            if _MOBILE_RE.match(normalized.replace(" ", "")):
                 # Assume valid if format matches (lightweight check)
                 result["exists"] = True
                 result["is_mobile"] = True
         
         # Cache result
-        self.whatsapp_cache[normalized] = result["exists"]
+        self._cache_set(self.whatsapp_cache, normalized, result["exists"])
         
         return result
     
@@ -152,8 +250,9 @@ class ContactValidator:
         }
         
         # Check cache
-        if email.lower() in self.email_cache:
-            cached = self.email_cache[email.lower()]
+        email_key = email.lower()
+        cached = self._cache_get(self.email_cache, email_key)
+        if cached is not None:
             result.update(cached)
             return result
         
@@ -167,19 +266,12 @@ class ContactValidator:
             domain = email_info.domain
         except EmailNotValidError as e:
             logger.debug(f"Email syntax invalid: {email} - {e}")
-            self.email_cache[email.lower()] = result
+            self._cache_set(self.email_cache, email_key, result)
             return result
         
         # 2. Check if personal vs general email
-        general_prefixes = [
-            "info", "admin", "contact", "support", "help", 
-            "noreply", "no-reply", "mail", "webmaster",
-            "kontak", "hubungi"
-        ]
         local_part = email.split("@")[0].lower()
-        result["is_personal"] = not any(
-            local_part.startswith(prefix) for prefix in general_prefixes
-        )
+        result["is_personal"] = not local_part.startswith(_GENERAL_PREFIXES)
         
         # 3. MX record check
         try:
@@ -193,7 +285,7 @@ class ContactValidator:
             try:
                 result["smtp_handshake"] = await self._smtp_handshake(
                     domain, 
-                    mx_records[0] if mx_records else None
+                    mx_records
                 )
             except Exception as e:
                 logger.debug(f"SMTP handshake failed for {domain}: {e}")
@@ -206,27 +298,55 @@ class ContactValidator:
         )
         
         # Cache result
-        self.email_cache[email.lower()] = result
+        self._cache_set(self.email_cache, email_key, result)
         
         return result
     
+    async def verify_emails(self, emails: List[str]) -> List[Dict[str, bool]]:
+        """
+        verify_email_live for many addresses concurrently
+        
+        Addresses on the same domain share one MX lookup and one SMTP
+        handshake. Results are returned in input order.
+        """
+        return list(await asyncio.gather(
+            *(self.verify_email_live(email) for email in emails)
+        ))
+    
     async def _check_mx_record(self, domain: str) -> list:
+        """MX hostnames for domain, looked up once per domain"""
+        return await self._coalesce(
+            self._mx_cache, domain.lower(), lambda: self._lookup_mx(domain)
+        )
+    
+    async def _lookup_mx(self, domain: str) -> list:
         """
         Check MX records for domain using DNS
         
         Returns list of MX hostnames
+        
+        Never blocks the event loop: aiodns when installed, else dnspython
+        in a worker thread, else the loop's own getaddrinfo.
         """
+        if AIODNS_AVAILABLE:
+            try:
+                mx_records = await self._dns_resolver().query(domain, 'MX')
+                return [mx.host for mx in mx_records]
+            except Exception as e:
+                logger.debug(f"DNS MX lookup failed for {domain}: {e}")
+                return []
+        
         if not DNS_AVAILABLE:
-            # Fallback: try socket.getaddrinfo for basic DNS check
+            # Fallback: try getaddrinfo for basic DNS check
             try:
-                socket.getaddrinfo(domain, 0)
+                await asyncio.get_running_loop().getaddrinfo(domain, 0)
                 return [f"mail.{domain}"]  # Assume mail server exists
             except:
                 return []
         
         try:
-            # Use dns.resolver for async DNS lookup
-            mx_records = dns.resolver.resolve(domain, 'MX')
+            # dns.resolver is synchronous; run it off the event loop
+            mx_records = await asyncio.to_thread(dns.resolver.resolve, domain, 'MX')
             return [str(mx.exchange) for mx in mx_records]
         except Exception as e:
             logger.debug(f"DNS MX lookup failed for {domain}: {e}")
@@ -235,61 +355,102 @@ class ContactValidator:
     async def _smtp_handshake(
         self, 
         domain: str, 
-        mx_host: Optional[str] = None
+        mx_hosts: Optional[List[str]] = None
+    ) -> bool:
+        """SMTP reachability of the domain's mail servers, checked once per domain"""
+        return await self._coalesce(
+            self._smtp_cache, domain.lower(), lambda: self._smtp_probe(domain, mx_hosts)
+        )
+    
+    async def _smtp_probe(
+        self, 
+        domain: str, 
+        mx_hosts: Optional[List[str]] = None
     ) -> bool:
+        """Handshake with up to _SMTP_MAX_HOSTS MX hosts at once; first success wins"""
+        # Try common mail servers when DNS gave no MX hosts
+        hosts = (mx_hosts or [])[:_SMTP_MAX_HOSTS] or [f"mail.{domain}"]
+        
+        tasks = [asyncio.ensure_future(self._smtp_connect(host)) for host in hosts]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                if await next_done:
+                    return True
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _dns_resolver(self) -> "aiodns.DNSResolver":
+        """aiodns resolver bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._resolver is None or self._resolver_loop is not loop:
+            # (the singleton outlives the per-job loops used by the API)
+            self._resolver = aiodns.DNSResolver(loop=loop, timeout=3.0)
+            self._resolver_loop = loop
+        return self._resolver
+    
+    def _smtp_semaphore(self) -> asyncio.Semaphore:
+        """Port-25 connection cap for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._smtp_slots is None or self._smtp_slots_loop is not loop:
+            # (the singleton outlives the per-job loops used by the API)
+            self._smtp_slots = asyncio.Semaphore(_SMTP_MAX_CONNECTIONS)
+            self._smtp_slots_loop = loop
+        return self._smtp_slots
+    
+    async def _smtp_connect(self, mx_host: str) -> bool:
         """
         Perform SMTP handshake to verify mailbox exists
         
         Does NOT send an email, just checks if server accepts connection
         """
-        if not mx_host:
-            # Try common mail servers
-            mx_host = f"mail.{domain}"
-        
         try:
-            # Try to connect to SMTP server (port 25)
-            # Use asyncio for non-blocking connection
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(mx_host, 25),
-                timeout=5.0
-            )
-            
-            # Read greeting
-            greeting = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            async with self._smtp_semaphore():
+                return await asyncio.wait_for(
+                    self._smtp_exchange(mx_host), timeout=_SMTP_TIMEOUT
+                )
+        except (asyncio.TimeoutError, OSError, Exception) as e:
+            logger.debug(f"SMTP handshake failed for {mx_host}: {e}")
+            return False
+    
+    async def _smtp_exchange(self, mx_host: str) -> bool:
+        """Connect to port 25, read the greeting, send EHLO, and check for a 250 reply"""
+        reader, writer = await asyncio.open_connection(mx_host, 25)
+        try:
+            # Read the whole (possibly multi-line "220-") greeting before
+            # speaking; talking first trips pregreet checks like postscreen
+            greeting = await reader.readline()
+            while greeting.startswith(b"220-"):
+                greeting = await reader.readline()
+            if not greeting.startswith(b"220"):
+                return False
             
-            # Send EHLO
             writer.write(b"EHLO localhost\r\n")
             await writer.drain()
-            
-            # Read response
-            response = await asyncio.wait_for(reader.readline(), timeout=5.0)
-            
-            writer.close()
-            await writer.wait_closed()
+            response = await reader.readline()
             
             # If we got a response, server is reachable
             return response.startswith(b"250")
-            
-        except (asyncio.TimeoutError, OSError, Exception) as e:
-            logger.debug(f"SMTP handshake failed for {mx_host}: {e}")
-            return False
+        finally:
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
     
     def _normalize_phone(self, phone: str) -> Optional[str]:
         """Normalize phone to +62 format"""
         if not phone:
             return None
         
-        # Remove all non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', phone)
-        
-        if cleaned.startswith('08'):
-            return '+62' + cleaned[1:]
-        elif cleaned.startswith('62') and not cleaned.startswith('+'):
-            return '+' + cleaned
-        elif cleaned.startswith('+62'):
-            return cleaned
-        
-        return None
+        # Remove all non-digit characters except +, then dispatch on the prefix
+        return _to_plus62(_clean_phone(phone))
+    
+    def normalize_phones(self, phones: List[str]) -> List[Optional[str]]:
+        """_normalize_phone over many numbers, in input order"""
+        return [
+            _to_plus62(_clean_phone(phone)) if phone else None
+            for phone in phones
+        ]
 
 
 # Singleton instance